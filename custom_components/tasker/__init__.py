@@ -1,7 +1,10 @@
 """Support for Tasker Android app"""
-from typing import Any
+from typing import Any, Callable, Iterable
+import asyncio
 import logging
-from datetime import timedelta
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from functools import partial
 
 import voluptuous as vol
 
@@ -19,17 +22,15 @@ from homeassistant.const import (
     CONF_COMMAND,
     CONF_HOST,
     CONF_NAME,
-    CONF_PARAMS,
     CONF_PORT,
-    CONF_PREFIX,
     CONF_SCAN_INTERVAL,
     CONF_VARIABLES,
     Platform,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady, ConfigEntryAuthFailed
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.device_registry import (
     CONNECTION_NETWORK_MAC,
     format_mac,
@@ -38,12 +39,15 @@ from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
     async_dispatcher_send,
 )
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity import DeviceInfo, Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
     UpdateFailed,
 )
+import homeassistant.util.dt as dt_util
 
 from taskerapi import TaskerClient, tasks
 from taskerapi.const import (
@@ -60,19 +64,64 @@ from taskerapi.const import (
 from taskerapi.exceptions import TaskerAuthError
 from taskerapi.typing import (
     TaskerStats,
-    TaskerProfile,
-    TaskerTask,
-    TaskerScene,
     TaskerGlobal,
 )
 
 from .const import (
     DOMAIN,
+    ATTR_CHANGES,
+    ATTR_DATA,
     ATTR_DEVICE_INFO,
+    ATTR_NAMES,
+    ATTR_STATS,
+    CONF_ADAPTIVE_POLLING,
+    CONF_BATCH_COMMANDS,
+    CONF_CACHED_TASKS,
+    CONF_COMMAND_INTERVAL,
+    CONF_FAST_OBJECTS,
+    CONF_FAST_SCAN_INTERVAL,
+    CONF_LAZY_ENTITIES,
+    CONF_MAX_CONCURRENT,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_POLL_TIER,
+    CONF_SLOW_OBJECTS,
+    CONF_SLOW_SCAN_INTERVAL,
+    CONF_STRUCTURE_GLOBALS,
+    CONF_TASK_CACHE_TTL,
+    BUILTIN_GLOBALS,
+    DEFAULT_MAX_CONCURRENT,
     DEFAULT_NAME,
+    FAST_SCAN_INTERVAL,
+    MAX_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
     SCAN_INTERVAL,
-    TASKER_COMMAND,
+    SLOW_SCAN_INTERVAL,
+    SIGNAL_NEW_OBJECTS,
+    SNAPSHOT_SAVE_DELAY,
+    STORAGE_KEY,
+    STORAGE_VERSION,
+    TASK_CACHE_TTL,
+    TaskerPollTier,
 )
+from .cache import TaskerTaskCache
+from .client import TaskerChanges, TaskerResilientClient
+from .commands import TaskerCommandChannel
+from .helpers import (
+    TaskerGlobalRecord,
+    TaskerOutputParser,
+    TaskerProfileRecord,
+    TaskerRecord,
+    TaskerSceneRecord,
+    TaskerTaskRecord,
+    merge_records,
+)
+from .journal import TaskerCommandJournal
+from .polling import PollGroup, TaskerPollScheduler, poll_key
+from .session import async_get_session_pool
+from .views import async_register_views
+from .webhook import async_ensure_webhook_id, async_register_webhook
+from .writer import TaskerWriteQueue
 
 PLATFORMS = [
     Platform.BINARY_SENSOR,
@@ -83,6 +132,35 @@ PLATFORMS = [
     Platform.TEXT,
 ]
 
+CATEGORY_PLATFORMS = {
+    ATTR_PROFILES: Platform.SWITCH,
+    ATTR_TASKS: Platform.BINARY_SENSOR,
+    ATTR_SCENES: Platform.SELECT,
+    ATTR_GLOBALS: Platform.TEXT,
+}
+
+CATEGORY_RECORDS: dict[str, type[TaskerRecord]] = {
+    ATTR_PROFILES: TaskerProfileRecord,
+    ATTR_TASKS: TaskerTaskRecord,
+    ATTR_SCENES: TaskerSceneRecord,
+    ATTR_GLOBALS: TaskerGlobalRecord,
+}
+
+# Options that change the polling schedule
+POLL_OPTIONS = frozenset({
+    CONF_SCAN_INTERVAL,
+    CONF_FAST_SCAN_INTERVAL,
+    CONF_SLOW_SCAN_INTERVAL,
+    CONF_ADAPTIVE_POLLING,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_FAST_OBJECTS,
+    CONF_SLOW_OBJECTS,
+    *(CONF_POLL_TIER.format(category) for category in CATEGORY_PLATFORMS),
+})
+# Options that can only be applied by reloading the entry
+RELOAD_OPTIONS = frozenset({CONF_LAZY_ENTITIES})
+
 _LOGGER = logging.getLogger(__name__)
 
 """
@@ -138,33 +216,31 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             )
         )
         
+        async_ensure_webhook_id(hass, entry)
+        async_register_views(hass)
         entry.async_on_unload(entry.add_update_listener(async_update_options))
         
         coordinator = TaskerDataUpdateCoordinator(hass, entry, scan_interval)
         await coordinator.async_config_entry_first_refresh()
         
-        @callback
-        def tasker_commands_listener():
-            for cmd in coordinator.data.commands:
-                cmd_split = cmd.split("=:=")
-                hass.bus.async_fire(
-                    TASKER_COMMAND,
-                    {
-                        CONF_COMMAND: cmd,
-                        CONF_PREFIX: cmd_split[0],
-                        CONF_PARAMS: cmd_split[1:]
-                    }
-                )
         if entry.options.get(CONF_COMMAND, True):
-            entry.async_on_unload(
-                coordinator.async_add_listener(tasker_commands_listener)
-            )
+            await coordinator.commands.journal.async_load()
+            coordinator.commands.async_start()
+        entry.async_on_unload(coordinator.commands.async_stop)
+        
+        entry.async_on_unload(
+            async_register_webhook(hass, entry, coordinator)
+        )
         
         #_LOGGER.warning(coordinator.device_info)
     
         hass.data[DOMAIN][entry.entry_id] = coordinator
     
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+        if coordinator._revalidate_task is None:
+            # Without a snapshot, the first refresh ran before any entity
+            # was enabled and only fetched stats and device info
+            await coordinator.async_request_refresh()
         hass.data[DOMAIN][entry.entry_id].async_update_listeners()
     except Exception as e:
         _LOGGER.error("Error setting up entry: %s", e)
@@ -174,7 +250,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
 async def async_update_options(hass: HomeAssistant, entry: ConfigEntry):
     """Update a config entry's options."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if coordinator is None or not await coordinator.async_apply_options():
+        await hass.config_entries.async_reload(entry.entry_id)
     
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
@@ -183,9 +261,22 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         PLATFORMS,
     ):
         coordinator = hass.data[DOMAIN][entry.entry_id]
+        if coordinator._discovery_task:
+            coordinator._discovery_task.cancel()
+        if coordinator._revalidate_task:
+            coordinator._revalidate_task.cancel()
+        # A delayed save left pending would outlive the entry
+        await coordinator.async_save_snapshot()
         hass.data[DOMAIN].pop(entry.entry_id)
 
     return unload_ok
+    
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove a config entry's snapshot and command journal."""
+    await Store(
+        hass, STORAGE_VERSION, STORAGE_KEY.format(entry.entry_id)
+    ).async_remove()
+    await TaskerCommandJournal(hass, entry.entry_id).async_remove()
 
 class TaskerEntity(CoordinatorEntity):
     """Base Tasker entity class"""
@@ -197,9 +288,7 @@ class TaskerEntity(CoordinatorEntity):
         super().__init__(coordinator, context=name)
         
         self._attr_name = name or coordinator.entry.data[CONF_NAME]
-        self._attr_unique_id = coordinator.entry.unique_id
-        if name:
-            self._attr_unique_id += "_" + cv.slugify(name)
+        self._attr_unique_id = coordinator.unique_id_for(name)
         #self._attr_device_info = coordinator.device_info
         
         #if init_data:
@@ -217,6 +306,31 @@ class TaskerEntity(CoordinatorEntity):
     def has_entity_name(self) -> bool:
         return True
         
+def _stats_totals(stats: TaskerStats) -> tuple[int, int, int, int]:
+    return (
+        stats.total_profiles,
+        stats.total_tasks,
+        stats.total_scenes,
+        stats.total_globals,
+    )
+    
+def _changed_names(
+    old: 'TaskerData | None', new: 'TaskerData'
+) -> set[str] | None:
+    """Return names of objects that differ, or None if all may have"""
+    if old is None:
+        return None
+    changed: set[str] = set()
+    for category in (ATTR_PROFILES, ATTR_TASKS, ATTR_SCENES, ATTR_GLOBALS):
+        prev = getattr(old, category)
+        cur = getattr(new, category)
+        # Merging keeps unchanged records, so compare identities
+        changed.update(
+            name for name in prev.keys() | cur.keys()
+            if prev.get(name) is not cur.get(name)
+        )
+    return changed
+    
 def _validate_info(device_info) -> bool:
     return device_info and (
         ATTR_IDENTIFIERS in device_info or
@@ -225,66 +339,93 @@ def _validate_info(device_info) -> bool:
     
 class TaskerData:
     """Class representing data from update coordinator"""
+    __slots__ = (
+        "stats",
+        "stale",
+        "profiles",
+        "tasks",
+        "scenes",
+        "globals",
+        "num_active_profiles",
+    )
+    
     def __init__(self, stats: TaskerStats):
         self.stats: TaskerStats = stats
         
-        self.commands: list[str] = []
+        self.stale: dict[str, datetime] = {}
         
-        self.profiles: dict[str, TaskerProfile] = {}
-        self.tasks: dict[str, TaskerTask] = {}
-        self.scenes: dict[str, TaskerScene] = {}
-        self.globals: dict[str, TaskerGlobal] = {}
-        
-        if False:
-            self.profiles_to_add = prev.profiles_to_add
-            self.tasks_to_add = prev.tasks_to_add
-            self.scenes_to_add = prev.scenes_to_add
-            self.globals_to_add = prev.globals_to_add
-        else:
-            self.profiles_to_add: set[str] = set()
-            self.tasks_to_add: set[str] = set()
-            self.scenes_to_add: set[str] = set()
-            self.globals_to_add: set[str] = set()
+        # Unchanged records are shared with the previous data
+        self.profiles: dict[str, TaskerProfileRecord] = {}
+        self.tasks: dict[str, TaskerTaskRecord] = {}
+        self.scenes: dict[str, TaskerSceneRecord] = {}
+        self.globals: dict[str, TaskerGlobalRecord] = {}
+        self.num_active_profiles: int = 0
         
     def __bool__(self) -> bool:
-        return bool(
-            self.profiles or self.profiles_to_add or
-            self.tasks or self.tasks_to_add or
-            self.scenes or self.scenes_to_add or
-            self.globals or self.globals_to_add
-        )
+        return bool(self.profiles or self.tasks or self.scenes or self.globals)
         
-    def has_profile(self, name: str) -> bool:
-        return name in self.profiles or name in self.profiles_to_add
+    def merge(self, category: str, objects: Iterable[Any]) -> None:
+        """Merge objects from the Tasker API into a category"""
+        merge_records(
+            getattr(self, category), objects, CATEGORY_RECORDS[category]
+        )
         
-    def has_task(self, name: str) -> bool:
-        return name in self.tasks or name in self.tasks_to_add
+    def as_dict(self) -> dict[str, Any]:
+        """Return the data as a JSON serializable dict"""
+        return {
+            ATTR_STATS: asdict(self.stats),
+            **{
+                category: [r.as_dict() for r in getattr(self, category).values()]
+                for category in CATEGORY_RECORDS
+            },
+        }
         
-    def has_scene(self, name: str) -> bool:
-        return name in self.scenes or name in self.scenes_to_add
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> 'TaskerData':
+        """Return data restored from as_dict"""
+        tasker_data = cls(TaskerStats(**data[ATTR_STATS]))
+        for category, record_cls in CATEGORY_RECORDS.items():
+            setattr(tasker_data, category, {
+                r["name"]: record_cls(**r) for r in data[category]
+            })
+        return tasker_data
         
-    def has_global(self, name: str) -> bool:
-        return name in self.globals or name in self.globals_to_add
+    def copy(self) -> 'TaskerData':
+        """Return a copy of the data"""
+        data = TaskerData(self.stats)
+        data.profiles = dict(self.profiles)
+        data.tasks = dict(self.tasks)
+        data.scenes = dict(self.scenes)
+        data.globals = dict(self.globals)
+        data.stale = dict(self.stale)
+        data.num_active_profiles = self.num_active_profiles
+        return data
 
 class TaskerDataUpdateCoordinator(DataUpdateCoordinator):
     """Tasker data update coordinator"""
     def __init__(self,
         hass: HomeAssistant,
         entry: ConfigEntry,
-        scan_interval: timedelta = SCAN_INTERVAL,
+        scan_interval: timedelta = timedelta(seconds=SCAN_INTERVAL),
     ) -> None:
         self.entry = entry
         #self.builtins: set[str] = set(entry.options.get(CONF_VARIABLES, []))
         
-        @callback
-        def create_session(**kwargs):
-            return async_create_clientsession(hass, False)
-        self.client = TaskerClient(
+        self.client = async_get_session_pool(hass).async_acquire(
             entry.data[CONF_HOST],
             entry.data[CONF_PORT],
             entry.data.get(CONF_API_KEY)
                 if entry.data.get(CONF_AUTHENTICATION) else None,
-            #session_fn=create_session
+            TaskerResilientClient,
+            max_concurrent=entry.options.get(
+                CONF_MAX_CONCURRENT, DEFAULT_MAX_CONCURRENT
+            ),
+        )
+        entry.async_on_unload(
+            partial(
+                async_get_session_pool(hass).async_release,
+                entry.data[CONF_HOST],
+            )
         )
         
         self.all_profiles: set[str] = set()
@@ -301,7 +442,44 @@ class TaskerDataUpdateCoordinator(DataUpdateCoordinator):
         )
         
         self._fetch_all: bool = True
+        self._discovery_task: asyncio.Task | None = None
+        self.writer = TaskerWriteQueue(hass, self)
+        entry.async_on_unload(self.writer.async_cancel)
+        self.commands = TaskerCommandChannel(
+            hass,
+            self,
+            TaskerCommandJournal(hass, entry.entry_id),
+            self._command_interval(),
+            entry.options.get(CONF_BATCH_COMMANDS, False),
+        )
+        self._changed: set[str] | None = None
+        self._notified_success: bool | None = None
         self._device_info: DeviceInfo | None = None
+        self._store = Store(
+            hass, STORAGE_VERSION, STORAGE_KEY.format(entry.entry_id)
+        )
+        self._revalidate_task: asyncio.Task | None = None
+        # Category fingerprints reported by Tasker when each group was fetched
+        self._fingerprints: dict[PollGroup, str] = {}
+        # Tried until Tasker shows it doesn't report changes
+        self._delta_sync: bool = True
+        self._cursor: int | None = None
+        
+        self.scheduler = TaskerPollScheduler(
+            **self._poll_config(scan_interval)
+        )
+        self._object_tiers = self._poll_object_tiers()
+        self._force_full: bool = False
+        self.parser = TaskerOutputParser()
+        # Full task outputs by entity id, served by TaskerLastReturnView
+        self.last_returns: dict[str, tuple[Any, bool]] = {}
+        self.task_cache = TaskerTaskCache(
+            entry.options.get(CONF_CACHED_TASKS, []),
+            entry.options.get(CONF_TASK_CACHE_TTL, TASK_CACHE_TTL),
+        )
+        # What the running entry was set up with, to apply only changes
+        self._entry_data = dict(entry.data)
+        self._options = dict(entry.options)
         
         super().__init__(
             hass,
@@ -310,11 +488,182 @@ class TaskerDataUpdateCoordinator(DataUpdateCoordinator):
             update_interval=scan_interval,
         )
         
+    def _poll_config(self, scan_interval: timedelta) -> dict[str, Any]:
+        """Return the polling scheduler's settings from the options"""
+        options = self.entry.options
+        return {
+            "intervals": {
+                TaskerPollTier.FAST: timedelta(
+                    seconds=options.get(
+                        CONF_FAST_SCAN_INTERVAL, FAST_SCAN_INTERVAL
+                    )
+                ),
+                TaskerPollTier.NORMAL: scan_interval,
+                TaskerPollTier.SLOW: timedelta(
+                    seconds=options.get(
+                        CONF_SLOW_SCAN_INTERVAL, SLOW_SCAN_INTERVAL
+                    )
+                ),
+            },
+            "adaptive": options.get(CONF_ADAPTIVE_POLLING, False),
+            "min_interval": timedelta(
+                seconds=options.get(CONF_MIN_SCAN_INTERVAL, MIN_SCAN_INTERVAL)
+            ),
+            "max_interval": timedelta(
+                seconds=options.get(CONF_MAX_SCAN_INTERVAL, MAX_SCAN_INTERVAL)
+            ),
+        }
+        
+    def _poll_object_tiers(self) -> dict[str, TaskerPollTier]:
+        """Return the objects whose polling tier overrides their category"""
+        return {
+            **{
+                key: TaskerPollTier.SLOW
+                for key in self.entry.options.get(CONF_SLOW_OBJECTS, [])
+            },
+            **{
+                key: TaskerPollTier.FAST
+                for key in self.entry.options.get(CONF_FAST_OBJECTS, [])
+            },
+        }
+        
+    def _command_interval(self) -> timedelta:
+        """Return the command polling interval, the scan interval if unset"""
+        options = self.entry.options
+        return timedelta(seconds=options.get(
+            CONF_COMMAND_INTERVAL,
+            options.get(
+                CONF_SCAN_INTERVAL,
+                self.entry.data.get(CONF_SCAN_INTERVAL, SCAN_INTERVAL),
+            ),
+        ))
+        
+    async def async_apply_options(self) -> bool:
+        """Apply changed options to the running entry, False to reload"""
+        options = dict(self.entry.options)
+        changed = {
+            key for key in options.keys() | self._options.keys()
+            if options.get(key) != self._options.get(key)
+        }
+        if self.entry.data != self._entry_data or changed & RELOAD_OPTIONS:
+            return False
+        self._options = options
+        if not changed:
+            return True
+        _LOGGER.debug("Applying changed Tasker options: %s", changed)
+        
+        if changed & POLL_OPTIONS:
+            self.scheduler.configure(**self._poll_config(timedelta(
+                seconds=options.get(
+                    CONF_SCAN_INTERVAL,
+                    self.entry.data.get(CONF_SCAN_INTERVAL, SCAN_INTERVAL),
+                )
+            )))
+            self._object_tiers = self._poll_object_tiers()
+        if CONF_MAX_CONCURRENT in changed:
+            self.client.scheduler.limit = options.get(
+                CONF_MAX_CONCURRENT, DEFAULT_MAX_CONCURRENT
+            )
+        if changed & {CONF_CACHED_TASKS, CONF_TASK_CACHE_TTL}:
+            self.task_cache.configure(
+                options.get(CONF_CACHED_TASKS, []),
+                options.get(CONF_TASK_CACHE_TTL, TASK_CACHE_TTL),
+            )
+        self.commands.interval = self._command_interval()
+        self.commands.batch = options.get(CONF_BATCH_COMMANDS, False)
+        if CONF_COMMAND in changed:
+            if options.get(CONF_COMMAND, True):
+                await self.commands.journal.async_load()
+                self.commands.async_start()
+            else:
+                self.commands.async_stop()
+        if CONF_VARIABLES in changed:
+            self._async_update_builtins(set(options.get(CONF_VARIABLES, [])))
+        if CONF_STRUCTURE_GLOBALS in changed:
+            await self._async_restructure_globals()
+        if changed & POLL_OPTIONS:
+            await self.async_request_refresh()
+        return True
+        
+    @callback
+    def _async_update_builtins(self, builtins: set[str]) -> None:
+        """Add and remove the entities of builtin globals"""
+        added = builtins - self.builtin_globals
+        removed = self.builtin_globals - builtins
+        self.builtin_globals = builtins
+        registry = er.async_get(self.hass)
+        for name in removed:
+            if entity_id := registry.async_get_entity_id(
+                Platform.TEXT,
+                DOMAIN,
+                self.unique_id_for(BUILTIN_GLOBALS[name]),
+            ):
+                registry.async_remove(entity_id)
+        if added:
+            async_dispatcher_send(
+                self.hass, self.signal_new(CONF_VARIABLES), added
+            )
+            
+    async def _async_restructure_globals(self) -> None:
+        """Set or clear the structured output of the current globals"""
+        if self.data is None:
+            return
+        structure = self.entry.options.get(CONF_STRUCTURE_GLOBALS, True)
+        values = {
+            name: (g.value, await self.parser.async_parse(self.hass, g.value))
+            for name, g in list(self.data.globals.items())
+            if structure
+        }
+        # A poll may have replaced the data while parsing
+        data = self.data.copy()
+        for name, g in data.globals.items():
+            value, value_json = values.get(name, (g.value, None))
+            if value == g.value:
+                data.globals[name] = TaskerGlobalRecord(
+                    name, g.value, value_json
+                )
+        self._changed = set(data.globals)
+        self.data = data
+        self.async_update_listeners()
+        
     @property
     def device_info(self) -> DeviceInfo | None:
         return self._device_info
         
+    @property
+    def device_id(self) -> str | None:
+        """Return the device registry id of the Tasker device"""
+        if not self._device_info:
+            return None
+        device = dr.async_get(self.hass).async_get_device(
+            self._device_info.get(ATTR_IDENTIFIERS, set()),
+            self._device_info.get(ATTR_CONNECTIONS),
+        )
+        return device.id if device else None
+        
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update listeners whose Tasker objects changed"""
+        changed, self._changed = self._changed, None
+        if changed is None or changed:
+            self._async_save_snapshot()
+        if changed is None or (
+            self._notified_success != self.last_update_success
+        ):
+            self._notified_success = self.last_update_success
+            super().async_update_listeners()
+            return
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in changed:
+                update_callback()
+        
     async def async_config_entry_first_refresh(self):
+        if await self.async_restore():
+            _LOGGER.info("Restored Tasker snapshot, revalidating")
+            self._revalidate_task = self.hass.async_create_task(
+                self.async_revalidate()
+            )
+            return
         try:
             await self.async_fetch_all()
             await self.async_device_info(self.entry.data.get(ATTR_NAME))
@@ -330,83 +679,250 @@ class TaskerDataUpdateCoordinator(DataUpdateCoordinator):
             raise ex
         await super().async_config_entry_first_refresh()
         
+    async def async_restore(self) -> bool:
+        """Restore the last snapshot, returning whether there was one"""
+        if not (snapshot := await self._store.async_load()):
+            return False
+        try:
+            data = TaskerData.from_dict(snapshot[ATTR_DATA])
+            names = snapshot[ATTR_NAMES]
+            device = snapshot[ATTR_DEVICE_INFO]
+            for key in (ATTR_IDENTIFIERS, ATTR_CONNECTIONS):
+                if key in device:
+                    device[key] = {tuple(v) for v in device[key]}
+            self.all_profiles = set(names[ATTR_PROFILES])
+            self.all_tasks = set(names[ATTR_TASKS])
+            self.all_scenes = set(names[ATTR_SCENES])
+            self.all_globals = set(names[ATTR_GLOBALS])
+        except (KeyError, TypeError) as e:
+            _LOGGER.warning("Ignoring invalid Tasker snapshot: %s", e)
+            return False
+        self._device_info = DeviceInfo(**device)
+        self.data = data
+        return True
+        
+    async def async_revalidate(self) -> None:
+        """Refresh everything restored from the snapshot"""
+        await self.async_discover()
+        try:
+            await self.async_device_info(self.entry.data.get(ATTR_NAME))
+        except Exception as e:
+            _LOGGER.warning("Error fetching Tasker device info: %s", e)
+        await self.async_refresh()
+        
+    def _snapshot(self) -> dict[str, Any]:
+        device = dict(self._device_info or {})
+        for key in (ATTR_IDENTIFIERS, ATTR_CONNECTIONS):
+            if key in device:
+                device[key] = [list(v) for v in device[key]]
+        return {
+            ATTR_DATA: self.data.as_dict(),
+            ATTR_NAMES: {
+                category: list(names)
+                for category, names in self._all_names().items()
+            },
+            ATTR_DEVICE_INFO: device,
+        }
+        
+    @callback
+    def _async_save_snapshot(self) -> None:
+        if self.data is not None and self._device_info:
+            self._store.async_delay_save(self._snapshot, SNAPSHOT_SAVE_DELAY)
+        
+    async def async_save_snapshot(self) -> None:
+        """Save the snapshot now, replacing a delayed save"""
+        if self.data is not None and self._device_info:
+            await self._store.async_save(self._snapshot())
+        
+    async def _async_fetch(self, category: str, fetch) -> Any:
+        """Fetch a category, the client limits concurrent requests"""
+        _LOGGER.info("Fetching Tasker %s", category)
+        return await fetch
+        
+    async def async_refresh(self) -> None:
+        """Refresh all polling tiers"""
+        self._force_full = True
+        await super().async_refresh()
+        
+    def poll_tier(self,
+        category: str, name: str | None = None
+    ) -> TaskerPollTier:
+        """Return the polling tier of a category or object"""
+        if name is not None and (
+            tier := self._object_tiers.get(poll_key(category, name))
+        ):
+            return tier
+        return TaskerPollTier(
+            self.entry.options.get(
+                CONF_POLL_TIER.format(category), TaskerPollTier.NORMAL
+            )
+        )
+        
+    def _poll_groups(self) -> set[PollGroup]:
+        groups = {(ATTR_STATS, TaskerPollTier.NORMAL)}
+        for category, names in self.enabled_names().items():
+            groups.update(
+                (category, self.poll_tier(category, name)) for name in names
+            )
+        return groups
+        
+    def _changed_groups(self,
+        results: dict[str, Any], data: 'TaskerData'
+    ) -> set[PollGroup] | None:
+        """Return the polled groups that produced changes"""
+        if self.data is None or self._changed is None:
+            return None
+        changed: set[PollGroup] = set()
+        if ATTR_STATS in results and data.stats != self.data.stats:
+            changed.add((ATTR_STATS, TaskerPollTier.NORMAL))
+        for category in (ATTR_PROFILES, ATTR_TASKS, ATTR_SCENES, ATTR_GLOBALS):
+            changed.update(
+                (category, self.poll_tier(category, o.name))
+                for o in results.get(category) or []
+                if o.name in self._changed
+            )
+        return changed
+        
     async def _async_update_data(self):
         try:
-            _LOGGER.info("Fetching Tasker stats")
-            stats = await self.client.async_get_stats()
-            data: TaskerData = TaskerData(stats)
-            
-            if self.entry.options.get(CONF_COMMAND):
-                _LOGGER.info("Fetching Tasker commands")
-                data.commands = await self.client.async_get_commands()
+            now = dt_util.utcnow()
+            groups = self._poll_groups()
+            full = self._force_full or self.data is None
+            self._force_full = False
+            changes = await self._async_fetch_changes(full)
+            # Without a known cursor every object is fetched again
+            delta = changes is not None and not changes.reset
+            due = self.scheduler.due(now, groups, full or (
+                changes is not None and changes.reset
+            ))
+            enabled = self.enabled_names()
             
-            if self.enabled_profiles:
-                _LOGGER.info("Fetching Tasker profiles")
-                profiles = await self.client.async_get_profiles(
-                    list(self.enabled_profiles)
+            results: dict[str, Any] = {}
+            fetches = {}
+            get_stats = self.client.async_get_stats_fingerprints
+            if (self._fingerprints and not full and not delta) or (
+                (ATTR_STATS, TaskerPollTier.NORMAL) in due
+            ):
+                # Categories whose fingerprint is unchanged are skipped. The
+                # fingerprints are taken before the categories, so a change
+                # in between is fetched again by the next poll
+                try:
+                    results[ATTR_STATS] = await self._async_fetch(
+                        ATTR_STATS, get_stats()
+                    )
+                except Exception as e:
+                    results[ATTR_STATS] = e
+            fingerprints: dict[str, str] = {}
+            if isinstance(results.get(ATTR_STATS), tuple):
+                fingerprints = results[ATTR_STATS][1]
+            skipped = {
+                group for group in due
+                if (delta and group[0] in changes.updated) or (
+                    group in self._fingerprints
+                    and self._fingerprints[group] == fingerprints.get(group[0])
                 )
-                data.num_active_profiles = sum(
-                    p.active for p in profiles
-                )
-                data.profiles = {
-                    p.name: p for p in profiles
-                    if p.name in self.enabled_profiles
-                } if profiles is not None else (
-                    self.data.profiles if self.data else {}
-                )
-                """
-                data.profiles_to_add.update([
-                    name for name in data.profiles if name not in self.data.profiles
-                ] if self.data else data.profiles.keys())
-                """
+            }
+            getters = {
+                ATTR_PROFILES: self.client.async_get_profiles,
+                ATTR_TASKS: self.client.async_get_tasks,
+                ATTR_SCENES: self.client.async_get_scenes,
+                ATTR_GLOBALS: partial(
+                    self.client.async_get_globals, structure_outputs=False
+                ),
+            }
+            for category, get in getters.items():
+                current = getattr(self.data, category, {})
+                if names := [
+                    name for name in enabled[category]
+                    if (group := (category, self.poll_tier(category, name)))
+                    in due
+                    # Skipped groups still fetch newly enabled objects
+                    and (group not in skipped or name not in current)
+                ]:
+                    fetches[category] = get(names)
             
-            if self.enabled_tasks:
-                _LOGGER.info("Fetching Tasker tasks")
-                tasks = await self.client.async_get_tasks(
-                    list(self.enabled_tasks)
-                )
-                data.tasks = {
-                    t.name: t for t in tasks
-                } if tasks is not None else (
-                    self.data.tasks if self.data else {}
+            results.update(zip(fetches, await asyncio.gather(
+                *(
+                    self._async_fetch(category, fetch)
+                    for category, fetch in fetches.items()
+                ),
+                return_exceptions=True,
+            )))
+            errors = {
+                category: results.pop(category)
+                for category, result in list(results.items())
+                if isinstance(result, BaseException)
+            }
+            if delta:
+                for category, objects in changes.updated.items():
+                    results[category] = objects + (results.get(category) or [])
+            for category, error in errors.items():
+                if not results or self.data is None or not isinstance(
+                    error, Exception
+                ) or isinstance(error, TaskerAuthError):
+                    raise error
+                _LOGGER.warning(
+                    "Error fetching Tasker %s, keeping last values: %s",
+                    category,
+                    error,
                 )
-                """
-                data.tasks_to_add.update([
-                    name for name in data.tasks if name not in self.data.tasks
-                ] if self.data else data.tasks.keys())
-                """
+            if ATTR_STATS in results:
+                results[ATTR_STATS], fingerprints = results[ATTR_STATS]
+            if changes is not None:
+                # Changes may have been missed while a category failed
+                self._cursor = None if any(
+                    category in errors for category in getters
+                ) else changes.cursor
+            # Groups are only known to match a fingerprint once fetched
+            for group in due:
+                if group[0] in errors or group[0] not in fingerprints:
+                    self._fingerprints.pop(group, None)
+                elif group[0] in results:
+                    self._fingerprints[group] = fingerprints[group[0]]
             
-            if self.enabled_scenes:
-                _LOGGER.info("Fetching Tasker scenes")
-                scenes = await self.client.async_get_scenes(
-                    list(self.enabled_scenes)
-                )
-                data.scenes = {
-                    s.name: s for s in scenes
-                } if scenes is not None else (
-                    self.data.scenes if self.data else {}
-                )
-                """
-                data.scenes_to_add.update([
-                    name for name in data.scenes if name not in self.data.scenes
-                ] if self.data else data.scenes.keys())
-                """
-            if self.enabled_globals:
-                _LOGGER.info("Fetching Tasker globals")
-                global_vars = await self.client.async_get_globals(
-                    list(self.enabled_globals)
-                )
-                data.globals = {
-                    g.name: g for g in global_vars
-                } if global_vars is not None else (
-                    self.data.globals if self.data else {}
-                )
-                """
-                data.globals_to_add.update([
-                    name for name in data.globals if name not in self.data.globals
-                ] if self.data else data.globals.keys())
-                """
-                
+            if self.data is not None:
+                data: TaskerData = self.data.copy()
+            else:
+                data = TaskerData(results[ATTR_STATS])
+            if ATTR_STATS in results:
+                data.stats = results[ATTR_STATS]
+                if self.data is not None and (
+                    _stats_totals(data.stats) != _stats_totals(self.data.stats)
+                ):
+                    self._async_schedule_discovery()
+            await self.async_structure_globals(results.get(ATTR_GLOBALS) or [])
+            for category in errors:
+                data.stale.setdefault(category, now)
+            for category in results:
+                data.stale.pop(category, None)
+            
+            # Objects in tiers that weren't due keep their last values
+            for category in getters:
+                current = getattr(data, category)
+                for name in current.keys() - enabled[category]:
+                    del current[name]
+                if delta:
+                    for name in changes.removed.get(category, []):
+                        current.pop(name, None)
+                if (objects := results.get(category)) is not None:
+                    data.merge(category, (
+                        o for o in objects if o.name in enabled[category]
+                    ))
+            data.num_active_profiles = sum(
+                p.active for p in data.profiles.values()
+            )
+            
+            self._changed = _changed_names(self.data, data)
+            self.scheduler.polled(
+                {group for group in due if group[0] not in errors},
+                now,
+                self._changed_groups(results, data),
+            )
+            # Failed categories are retried at their interval, not right away
+            self.scheduler.failed(
+                {group for group in due if group[0] in errors}, now
+            )
+            self.update_interval = self.scheduler.next_interval(now, groups)
             return data
         except UpdateFailed as e:
             _LOGGER.exception("Update Failed: %s", e)
@@ -415,19 +931,260 @@ class TaskerDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.exception("Error fetching data: %s", e)
             raise UpdateFailed() from e
             
+    async def _async_fetch_changes(self,
+        full: bool
+    ) -> TaskerChanges | None:
+        """Return changes since the last poll, or None to poll instead"""
+        if not self._delta_sync:
+            return None
+        try:
+            changes = await self._async_fetch(
+                ATTR_CHANGES,
+                self.client.async_get_changes(None if full else self._cursor),
+            )
+        except TaskerAuthError:
+            raise
+        except Exception as e:
+            # Trying again every poll would add a failing request each time,
+            # so poll for the rest of the session
+            _LOGGER.info(
+                "Error fetching Tasker changes, polling instead: %s", e
+            )
+            self._delta_sync = False
+            self._cursor = None
+            return None
+        if changes is None:
+            _LOGGER.info("Tasker doesn't report changes, polling instead")
+            self._delta_sync = False
+        return changes
+        
+    async def async_structure_globals(self,
+        objects: list[TaskerGlobal]
+    ) -> None:
+        """Set the structured output of globals, reusing unchanged values"""
+        if not self.entry.options.get(CONF_STRUCTURE_GLOBALS, True):
+            return
+        current = self.data.globals if self.data is not None else {}
+        for g in objects:
+            if (prev := current.get(g.name)) is not None and (
+                prev.value == g.value
+            ):
+                g.value_json = prev.value_json
+            else:
+                g.value_json = await self.parser.async_parse(
+                    self.hass, g.value
+                )
+            
     async def async_fetch_all(self):
-        self.all_profiles: set[str] = set(
-            p.name for p in await self.client.async_get_profiles() or []
+        profiles, tasks, scenes, global_vars = await asyncio.gather(
+            self._async_fetch(ATTR_PROFILES, self.client.async_get_profiles()),
+            self._async_fetch(ATTR_TASKS, self.client.async_get_tasks()),
+            self._async_fetch(ATTR_SCENES, self.client.async_get_scenes()),
+            self._async_fetch(
+                ATTR_GLOBALS,
+                self.client.async_get_globals(structure_outputs=False),
+            ),
         )
-        self.all_tasks: set[str] = set(
-            t.name for t in await self.client.async_get_tasks() or []
+        self.all_profiles: set[str] = set(p.name for p in profiles or [])
+        self.all_tasks: set[str] = set(t.name for t in tasks or [])
+        self.all_scenes: set[str] = set(s.name for s in scenes or [])
+        self.all_globals: set[str] = set(g.name for g in global_vars or [])
+        
+    def enabled_names(self) -> dict[str, set[str]]:
+        """Return the names of enabled objects by category"""
+        return {
+            ATTR_PROFILES: self.enabled_profiles,
+            ATTR_TASKS: self.enabled_tasks,
+            ATTR_SCENES: self.enabled_scenes,
+            ATTR_GLOBALS: self.enabled_globals,
+        }
+        
+    @callback
+    def async_push_update(self, updates: dict[str, list[Any]]) -> None:
+        """Apply changes pushed by Tasker to the current data"""
+        # Callers structure globals first, that may need the executor
+        if self.data is None:
+            return
+        data = self.data.copy()
+        enabled = self.enabled_names()
+        for category, objects in updates.items():
+            data.merge(category, (
+                obj for obj in objects if obj.name in enabled[category]
+            ))
+        self._changed = _changed_names(self.data, data)
+        # Keep the poll schedule, it is only a consistency sweep now
+        self.data = data
+        self.async_update_listeners()
+        
+    async def async_refresh_objects(self,
+        category: str, names: list[str]
+    ) -> None:
+        """Refetch only the given objects and merge them into the data"""
+        fetch = {
+            ATTR_PROFILES: self.client.async_get_profiles,
+            ATTR_TASKS: self.client.async_get_tasks,
+            ATTR_SCENES: self.client.async_get_scenes,
+            ATTR_GLOBALS: partial(
+                self.client.async_get_globals, structure_outputs=False
+            ),
+        }[category]
+        try:
+            objects = await self._async_fetch(category, fetch(list(names)))
+        except Exception as e:
+            _LOGGER.warning("Error refreshing Tasker %s: %s", category, e)
+            await self.async_request_refresh()
+            return
+        if category == ATTR_GLOBALS:
+            await self.async_structure_globals(objects or [])
+        self.async_push_update({category: objects or []})
+        
+    def _all_names(self) -> dict[str, set[str]]:
+        return {
+            ATTR_PROFILES: self.all_profiles,
+            ATTR_TASKS: self.all_tasks,
+            ATTR_SCENES: self.all_scenes,
+            ATTR_GLOBALS: self.all_globals,
+        }
+        
+    @callback
+    def async_add_object_entities(self,
+        category: str,
+        factory: Callable[[str], Entity],
+        async_add_entities: AddEntitiesCallback,
+    ) -> None:
+        """Add entities for a category's objects, now and when discovered"""
+        lazy = self.entry.options.get(CONF_LAZY_ENTITIES, False)
+        # Unique ids of registry placeholders, to the names of their objects
+        placeholders: dict[str, str] = {}
+        
+        @callback
+        def async_add(names: set[str]) -> None:
+            if lazy:
+                names = self._async_materialize(category, names, placeholders)
+            async_add_entities(factory(name) for name in names)
+            
+        async_add(self._all_names()[category])
+        self.entry.async_on_unload(
+            async_dispatcher_connect(
+                self.hass, self.signal_new(category), async_add
+            )
         )
-        self.all_scenes: set[str] = set(
-            s.name for s in await self.client.async_get_scenes() or []
+        if not lazy:
+            return
+        
+        @callback
+        def async_registry_updated(event: Event) -> None:
+            if event.data["action"] != "update" or (
+                "disabled_by" not in event.data.get("changes", {})
+            ):
+                return
+            registry = er.async_get(self.hass)
+            if (
+                (entity := registry.async_get(event.data["entity_id"]))
+                and entity.config_entry_id == self.entry.entry_id
+                and not entity.disabled
+                and (name := placeholders.pop(entity.unique_id, None))
+            ):
+                _LOGGER.info("Adding enabled Tasker %s: %s", category, name)
+                async_add_entities([factory(name)])
+                
+        self.entry.async_on_unload(
+            self.hass.bus.async_listen(
+                er.EVENT_ENTITY_REGISTRY_UPDATED, async_registry_updated
+            )
         )
-        self.all_globals: set[str] = set(
-            g.name for g in await self.client.async_get_globals() or []
+        
+    @callback
+    def _async_materialize(self,
+        category: str,
+        names: set[str],
+        placeholders: dict[str, str],
+    ) -> list[str]:
+        """Return names with enabled entities, registering the rest"""
+        registry = er.async_get(self.hass)
+        platform = CATEGORY_PLATFORMS[category]
+        device_id = self._async_device_id()
+        device_name = (self._device_info or {}).get(
+            ATTR_NAME, self.entry.data.get(CONF_NAME)
         )
+        enabled = []
+        for name in names:
+            unique_id = self.unique_id_for(name)
+            if entity_id := registry.async_get_entity_id(
+                platform, DOMAIN, unique_id
+            ):
+                if not registry.async_get(entity_id).disabled:
+                    enabled.append(name)
+                    continue
+            else:
+                # Same entry the entity platform creates for a disabled entity
+                registry.async_get_or_create(
+                    platform,
+                    DOMAIN,
+                    unique_id,
+                    suggested_object_id=f"{device_name} {name}",
+                    config_entry=self.entry,
+                    device_id=device_id,
+                    disabled_by=er.RegistryEntryDisabler.INTEGRATION,
+                    has_entity_name=True,
+                    original_name=name,
+                )
+            placeholders[unique_id] = name
+        return enabled
+        
+    @callback
+    def _async_device_id(self) -> str | None:
+        """Return the device registry id, creating the device if needed"""
+        if not self._device_info:
+            return None
+        return dr.async_get(self.hass).async_get_or_create(
+            config_entry_id=self.entry.entry_id, **self._device_info
+        ).id
+        
+    def signal_new(self, category: str) -> str:
+        """Return the dispatcher signal for newly discovered objects"""
+        return SIGNAL_NEW_OBJECTS.format(self.entry.entry_id, category)
+        
+    def unique_id_for(self, name: str | None) -> str:
+        """Return the entity unique id for a Tasker object"""
+        unique_id = self.entry.unique_id
+        if name:
+            unique_id += "_" + cv.slugify(name)
+        return unique_id
+        
+    @callback
+    def _async_schedule_discovery(self) -> None:
+        if self._discovery_task is None or self._discovery_task.done():
+            self._discovery_task = self.hass.async_create_task(
+                self.async_discover()
+            )
+        
+    async def async_discover(self) -> None:
+        """Rediscover Tasker objects, adding and removing entities"""
+        previous = {
+            category: set(names)
+            for category, names in self._all_names().items()
+        }
+        try:
+            await self.async_fetch_all()
+        except Exception as e:
+            _LOGGER.warning("Error rediscovering Tasker objects: %s", e)
+            return
+        registry = er.async_get(self.hass)
+        for category, names in self._all_names().items():
+            if added := names - previous[category]:
+                _LOGGER.info("Discovered new Tasker %s: %s", category, added)
+                async_dispatcher_send(
+                    self.hass, self.signal_new(category), added
+                )
+            for name in previous[category] - names:
+                _LOGGER.info("Removing Tasker %s: %s", category, name)
+                if entity_id := registry.async_get_entity_id(
+                    CATEGORY_PLATFORMS[category],
+                    DOMAIN,
+                    self.unique_id_for(name),
+                ):
+                    registry.async_remove(entity_id)
         
     async def async_device_info(self, name: str | None = None) -> DeviceInfo | None:
         _LOGGER.info("Fetching device info")
@@ -1,6 +1,7 @@
 """Support for Tasker tasks."""
 from __future__ import annotations
 
+from functools import partial
 from typing import Any
 import logging
 
@@ -21,28 +22,34 @@ from homeassistant.helpers.entity_platform import (
     AddEntitiesCallback,
     async_get_current_platform,
 )
-from homeassistant.helpers.json import json_dumps
 from homeassistant.helpers.typing import TemplateVarsType
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
 )
-from homeassistant.util.json import JsonArrayType, JsonObjectType
 
 from . import (
     TaskerEntity,
     TaskerDataUpdateCoordinator,
 )
+from .client import TaskerPriority, request_priority
 from .const import (
     DOMAIN,
     ATTR_TASKS,
+    ATTR_CACHE_HITS,
+    ATTR_CACHE_MISSES,
     ATTR_RUNNING,
     ATTR_LAST_RETURN,
+    ATTR_LAST_RETURN_TRUNCATED,
+    ATTR_LAST_RETURN_URL,
     ATTR_PAR1,
     ATTR_PAR2,
     ATTR_VARIABLES,
     ATTR_STRUCTURE_OUTPUT,
+    LAST_RETURN_MAX_LENGTH,
     SERVICE_PERFORM_TASK,
 )
+from .helpers import async_process_task_output
+from .views import LAST_RETURN_URL
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -54,9 +61,10 @@ async def async_setup_entry(
     """Set up the sensor platform."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
     
-    async_add_entities(
-        TaskerTaskBinarySensor(coordinator, name)
-        for name in coordinator.all_tasks
+    coordinator.async_add_object_entities(
+        ATTR_TASKS,
+        partial(TaskerTaskBinarySensor, coordinator),
+        async_add_entities,
     )
     
     platform = async_get_current_platform()
@@ -84,6 +92,7 @@ class TaskerTaskBinarySensor(TaskerEntity, BinarySensorEntity):
         
         self._last_return = None
         self._last_return_is_json: bool = False
+        self._last_return_truncated: bool = False
         
     @property
     def device_class(self) -> BinarySensorDeviceClass:
@@ -98,18 +107,15 @@ class TaskerTaskBinarySensor(TaskerEntity, BinarySensorEntity):
         if data := self.coordinator.data.tasks.get(self.name):
             self._attr_is_on = data.running
             self.async_write_ha_state()
-        elif self.name not in self.coordinator.data.tasks_to_add:
-            self.hass and self.hass.async_add_job(self.async_remove)
             
     async def async_added_to_hass(self):
         await super().async_added_to_hass()
         self.coordinator.enabled_tasks.add(self.name)
-        if self.coordinator.data:
-            self.coordinator.data.tasks_to_add.discard(self.name)
             
     async def async_will_remove_from_hass(self):
         await super().async_will_remove_from_hass()
         self.coordinator.enabled_tasks.discard(self.name)
+        self.coordinator.last_returns.pop(self.entity_id, None)
             
     @property
     def last_return(self):
@@ -121,10 +127,32 @@ class TaskerTaskBinarySensor(TaskerEntity, BinarySensorEntity):
             
     @property
     def extra_state_attributes(self):
-        return {
+        attrs = {
             ATTR_LAST_RETURN: self.last_return
         }
+        if self._last_return_truncated:
+            attrs[ATTR_LAST_RETURN_TRUNCATED] = True
+            attrs[ATTR_LAST_RETURN_URL] = LAST_RETURN_URL.format(
+                entity_id=self.entity_id
+            )
+        if (cache := self.coordinator.task_cache).enabled(self.name):
+            attrs[ATTR_CACHE_HITS] = cache.hits.get(self.name, 0)
+            attrs[ATTR_CACHE_MISSES] = cache.misses.get(self.name, 0)
+        return attrs
     
+    async def _async_perform_task(self,
+        variables: dict[str, Any],
+        structure_output: bool,
+    ) -> tuple[Any, bool]:
+        data, encoding = await self.coordinator.client.async_perform_task_raw(
+            self.name,
+            structure_output,
+            variables,
+        )
+        return await async_process_task_output(
+            self.hass, data, encoding, structure_output
+        )
+        
     async def async_perform(self,
         par1: str | None = None,
         par2: str | None = None,
@@ -139,26 +167,28 @@ class TaskerTaskBinarySensor(TaskerEntity, BinarySensorEntity):
        # for k, v in variables.items():
            # _LOGGER.warning(v)
             #variables[k] = template.render_complex(v, template_vars)
-        resp = await self.coordinator.client.async_perform_task(
-            self.name,
-            structure_output,
-            variables,
-        )
+        with request_priority(TaskerPriority.INTERACTIVE):
+            resp, is_json = await self.coordinator.task_cache.async_get(
+                self.name,
+                (
+                    par1,
+                    par2,
+                    tuple(sorted((variables or {}).items())),
+                    structure_output,
+                ),
+                partial(self._async_perform_task, variables, structure_output),
+            )
         if resp is not None:
-            if structure_output and (
-                type(resp) is JsonArrayType or
-                type(resp) is JsonObjectType
-            ):
-                self._last_return = json_dumps(resp)
-                self._last_return_is_json = True
+            self._last_return_is_json = is_json
+            # Structured outputs stay native, cutting them would break them
+            self._last_return_truncated = (
+                isinstance(resp, str) and len(resp) > LAST_RETURN_MAX_LENGTH
+            )
+            if self._last_return_truncated:
+                # The full output is served by TaskerLastReturnView
+                self.coordinator.last_returns[self.entity_id] = (resp, is_json)
+                self._last_return = resp[:LAST_RETURN_MAX_LENGTH]
             else:
+                self.coordinator.last_returns.pop(self.entity_id, None)
                 self._last_return = resp
-                self._last_return_is_json = False
             self.async_write_ha_state()
-        
-        
-        
-        
-        
-        
-        
\ No newline at end of file
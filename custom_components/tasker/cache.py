@@ -0,0 +1,85 @@
+"""Result cache for performed Tasker tasks"""
+import asyncio
+from time import monotonic
+from typing import Any, Awaitable, Callable, Hashable, Iterable, TypeVar
+
+from .const import TASK_CACHE_SIZE
+
+_T = TypeVar("_T")
+
+class TaskerTaskCache:
+    """Share results of identical task calls for a while"""
+    def __init__(self,
+        names: Iterable[str],
+        ttl: float,
+        maxsize: int = TASK_CACHE_SIZE,
+    ) -> None:
+        self.names = set(names)
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits: dict[str, int] = {}
+        self.misses: dict[str, int] = {}
+        self._results: dict[tuple, tuple[float, Any]] = {}
+        self._inflight: dict[tuple, asyncio.Future] = {}
+
+    def enabled(self, name: str) -> bool:
+        return name in self.names
+
+    def configure(self, names: Iterable[str], ttl: float) -> None:
+        """Change the cached tasks and ttl, dropping stored results"""
+        self.names = set(names)
+        self.ttl = ttl
+        self._results.clear()
+
+    async def async_get(self,
+        name: str,
+        args: Hashable,
+        perform: Callable[[], Awaitable[_T]],
+    ) -> _T:
+        """Return a cached or in-flight result, performing the task if none"""
+        if name not in self.names:
+            return await perform()
+        key = (name, args)
+        if (cached := self._results.get(key)) and cached[0] > monotonic():
+            self.hits[name] = self.hits.get(name, 0) + 1
+            return cached[1]
+        while (future := self._inflight.get(key)) is not None:
+            # Identical calls in flight share the first call's result
+            try:
+                result = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # Only the caller that started the call was cancelled, retry
+                if not future.cancelled() or asyncio.current_task().cancelling():
+                    raise
+                continue
+            self.hits[name] = self.hits.get(name, 0) + 1
+            return result
+
+        self.misses[name] = self.misses.get(name, 0) + 1
+        future = self._inflight[key] = asyncio.get_running_loop().create_future()
+        # Nothing may be waiting to retrieve an error
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        try:
+            result = await perform()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            del self._inflight[key]
+        future.set_result(result)
+        if self.ttl > 0:
+            self._store(key, result)
+        return result
+
+    def _store(self, key: tuple, result: Any) -> None:
+        now = monotonic()
+        if len(self._results) >= self.maxsize:
+            self._results = {
+                k: v for k, v in self._results.items() if v[0] > now
+            }
+            while len(self._results) >= self.maxsize:
+                del self._results[next(iter(self._results))]
+        self._results[key] = (now + self.ttl, result)
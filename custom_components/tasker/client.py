@@ -0,0 +1,343 @@
+"""Resilient Tasker client"""
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, fields
+from enum import IntEnum
+import heapq
+from itertools import count
+import logging
+import random
+from time import monotonic
+from typing import Any, AsyncIterator, Iterator
+
+import aiohttp
+from aiohttp.hdrs import METH_GET, METH_POST
+
+from taskerapi import TaskerClient
+from taskerapi.const import (
+    ATTR_GLOBALS,
+    ATTR_PROFILES,
+    ATTR_SCENES,
+    ATTR_TASKS,
+    STATS_PATH,
+    TASKS_PATH,
+    TIMEOUT,
+)
+from taskerapi.exceptions import TaskerError, TaskerAuthError
+from taskerapi.typing import (
+    TaskerGlobalDecoded,
+    TaskerProfile,
+    TaskerScene,
+    TaskerStats,
+    TaskerTask,
+)
+
+from .const import (
+    ATTR_CURSOR,
+    ATTR_FINGERPRINTS,
+    ATTR_REMOVED,
+    ATTR_RESET,
+    CHANGES_PATH,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RESET_TIMEOUT,
+    DEFAULT_MAX_CONCURRENT,
+    RETRY_ATTEMPTS,
+    RETRY_BACKOFF,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_STATS_FIELDS = frozenset(f.name for f in fields(TaskerStats))
+_CHANGE_TYPES = {
+    ATTR_PROFILES: TaskerProfile,
+    ATTR_TASKS: TaskerTask,
+    ATTR_SCENES: TaskerScene,
+    ATTR_GLOBALS: TaskerGlobalDecoded,
+}
+
+class TaskerPriority(IntEnum):
+    """Priority of a request, lower values are sent first"""
+    INTERACTIVE = 0
+    COMMANDS = 1
+    POLL = 2
+    BACKUP = 3
+
+# Set while the half-open probe is running so it skips the breaker
+_probing: ContextVar[bool] = ContextVar("tasker_probing", default=False)
+# Set for optional endpoints, whose failures say nothing about the device
+_optional: ContextVar[bool] = ContextVar("tasker_optional", default=False)
+_priority: ContextVar[TaskerPriority] = ContextVar(
+    "tasker_priority", default=TaskerPriority.POLL
+)
+
+@contextmanager
+def request_priority(priority: TaskerPriority) -> Iterator[None]:
+    """Send the requests made inside the block with priority"""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+class TaskerRequestScheduler:
+    """Limit concurrent requests to a device, serving higher priority first"""
+    def __init__(self, limit: int = DEFAULT_MAX_CONCURRENT) -> None:
+        self._limit = limit
+        self._active: int = 0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._order = count()
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @limit.setter
+    def limit(self, limit: int) -> None:
+        # Raising the limit hands the new slots to waiting requests
+        self._limit = limit
+        while self._active < limit and self._wake():
+            pass
+
+    @asynccontextmanager
+    async def async_slot(self, priority: TaskerPriority) -> AsyncIterator[None]:
+        """Hold one of the device's request slots"""
+        await self._async_acquire(priority)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _async_acquire(self, priority: TaskerPriority) -> None:
+        if self._active < self.limit and not self._waiters:
+            self._active += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._order), waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before the cancellation
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        self._active -= 1
+        if self._active < self._limit:
+            self._wake()
+
+    def _wake(self) -> bool:
+        """Hand a slot to the first waiting request, if there is one"""
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                self._active += 1
+                waiter.set_result(None)
+                return True
+        return False
+
+@dataclass
+class TaskerChanges:
+    """Tasker objects changed since a cursor"""
+    cursor: int
+    # The cursor was unknown, so every object must be fetched again
+    reset: bool = False
+    updated: dict[str, list[Any]] = field(default_factory=dict)
+    removed: dict[str, list[str]] = field(default_factory=dict)
+
+class TaskerCircuitOpen(TaskerError):
+    """Raised while a Tasker device is known to be unreachable"""
+
+class TaskerCircuitBreaker:
+    """Track consecutive transport failures of a Tasker device"""
+    def __init__(self,
+        threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_RESET_TIMEOUT,
+    ) -> None:
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.failures: int = 0
+        self.opened_at: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    @property
+    def probe_due(self) -> bool:
+        """Return whether an open circuit may be probed again"""
+        return self.opened_at is not None and (
+            monotonic() - self.opened_at >= self.reset_timeout
+        )
+
+    def record_success(self) -> None:
+        if self.opened_at is not None:
+            _LOGGER.info("Tasker device is reachable again")
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.opened_at is not None or self.failures >= self.threshold:
+            if self.opened_at is None:
+                _LOGGER.warning(
+                    "Tasker device unreachable, pausing requests for %ss",
+                    self.reset_timeout,
+                )
+            self.opened_at = monotonic()
+
+class TaskerResilientClient(TaskerClient):
+    """Tasker client with retries, backoff, a circuit breaker and priorities"""
+    def __init__(self,
+        *args,
+        retries: int = RETRY_ATTEMPTS,
+        backoff: float = RETRY_BACKOFF,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.retries = retries
+        self.backoff = backoff
+        self.breaker = TaskerCircuitBreaker()
+        self.scheduler = TaskerRequestScheduler(max_concurrent)
+        self._probe_lock = asyncio.Lock()
+
+    async def _async_probe(self) -> None:
+        """Check an open circuit with the cheap stats request"""
+        async with self._probe_lock:
+            if not self.breaker.is_open:
+                return
+            if not self.breaker.probe_due:
+                raise TaskerCircuitOpen("Tasker device is unreachable")
+            token = _probing.set(True)
+            try:
+                await self.async_get_stats()
+            except Exception as e:
+                self.breaker.record_failure()
+                raise TaskerCircuitOpen("Tasker device is unreachable") from e
+            finally:
+                _probing.reset(token)
+            self.breaker.record_success()
+
+    async def _async_request(self,
+        session: aiohttp.ClientSession,
+        method: str,
+        path: str,
+        timeout: int = TIMEOUT,
+        **kwargs,
+    ) -> aiohttp.ClientResponse:
+        if _probing.get():
+            return await super()._async_request(
+                session, method, path, timeout, **kwargs
+            )
+        if self.breaker.is_open:
+            await self._async_probe()
+        optional = _optional.get()
+        # Only idempotent requests are retried
+        retries = self.retries if method == METH_GET and not optional else 0
+        priority = _priority.get()
+        for attempt in range(retries + 1):
+            try:
+                # Backoff between attempts doesn't hold a slot
+                async with self.scheduler.async_slot(priority):
+                    resp = await super()._async_request(
+                        session, method, path, timeout, **kwargs
+                    )
+                    # Large dumps count against the limit until they're read,
+                    # the response keeps the body for json() and read()
+                    async with asyncio.timeout(timeout):
+                        await resp.read()
+            except (TaskerAuthError, aiohttp.ClientResponseError):
+                # The device answered, so it is reachable
+                self.breaker.record_success()
+                raise
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == retries:
+                    if not optional:
+                        self.breaker.record_failure()
+                    raise
+                delay = self.backoff * 2 ** attempt * random.uniform(0.5, 1.5)
+                _LOGGER.debug(
+                    "Retrying Tasker %s %s in %.1fs: %s",
+                    method, path, delay, e,
+                )
+                await asyncio.sleep(delay)
+            else:
+                self.breaker.record_success()
+                return resp
+
+    async def async_get_stats(self) -> TaskerStats:
+        """Get Tasker statistics"""
+        stats, _ = await self.async_get_stats_fingerprints()
+        return stats
+
+    async def async_get_stats_fingerprints(
+        self,
+    ) -> tuple[TaskerStats, dict[str, str]]:
+        """Get Tasker statistics and the fingerprint of each category"""
+        data = await self._async_request_json(METH_GET, STATS_PATH)
+        # Changes whenever a category's objects do, older projects omit it
+        fingerprints = data.get(ATTR_FINGERPRINTS)
+        stats = TaskerStats(
+            **{key: value for key, value in data.items() if key in _STATS_FIELDS}
+        )
+        if not isinstance(fingerprints, dict):
+            return stats, {}
+        return stats, {
+            category: str(value)
+            for category, value in fingerprints.items()
+            if value is not None
+        }
+
+    async def async_get_changes(
+        self, since: int | None = None
+    ) -> TaskerChanges | None:
+        """Get objects changed since a cursor, None if not supported"""
+        token = _optional.set(True)
+        try:
+            data = await self._async_request_json(
+                METH_GET,
+                CHANGES_PATH,
+                params={"since": since} if since is not None else None,
+            )
+        except aiohttp.ClientResponseError as e:
+            if e.status == 404:
+                return None
+            raise
+        finally:
+            _optional.reset(token)
+        if not isinstance(data, dict) or ATTR_CURSOR not in data:
+            return None
+        changes = TaskerChanges(
+            int(data[ATTR_CURSOR]),
+            since is None or bool(data.get(ATTR_RESET)),
+        )
+        if changes.reset:
+            return changes
+        for category, object_cls in _CHANGE_TYPES.items():
+            changes.updated[category] = [
+                object_cls(**o) for o in data.get(category) or []
+            ]
+            changes.removed[category] = list(
+                (data.get(ATTR_REMOVED) or {}).get(category) or []
+            )
+        return changes
+
+    async def async_perform_task_raw(self,
+        name: str,
+        structure_output: bool = True,
+        kwargs={},
+        timeout: int = TIMEOUT,
+    ) -> tuple[bytes, str]:
+        """Perform a Tasker task, returning its unparsed output and encoding"""
+        return await self._async_request_bytes(
+            METH_POST,
+            TASKS_PATH,
+            timeout=max(timeout, TIMEOUT),
+            json=self._named_body(
+                name,
+                structure_output=structure_output,
+                variables=kwargs,
+            ),
+        )
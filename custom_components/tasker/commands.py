@@ -0,0 +1,156 @@
+"""Command channel for Tasker commands"""
+import asyncio
+from collections import OrderedDict
+from datetime import timedelta
+import logging
+
+from homeassistant.const import (
+    CONF_COMMAND,
+    CONF_DEVICE_ID,
+    CONF_PARAMS,
+    CONF_PREFIX,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.start import async_at_started
+
+from .client import TaskerPriority, request_priority
+from .const import (
+    ATTR_COMMANDS,
+    ATTR_SEQUENCE,
+    COMMAND_BUFFER_SIZE,
+    COMMAND_DEDUP_SIZE,
+    TASKER_COMMAND,
+    TASKER_COMMANDS,
+)
+from .journal import JournalEntry, TaskerCommandJournal
+
+_LOGGER = logging.getLogger(__name__)
+
+class TaskerCommandChannel:
+    """Fetch and fire Tasker commands independently of the state poll"""
+    def __init__(self,
+        hass: HomeAssistant,
+        coordinator,
+        journal: TaskerCommandJournal,
+        interval: timedelta,
+        batch: bool = False,
+        maxsize: int = COMMAND_BUFFER_SIZE,
+    ) -> None:
+        self.hass = hass
+        self.coordinator = coordinator
+        self.interval = interval
+        self.batch = batch
+        self.journal = journal
+        # Ids of recently accepted batches, so redeliveries are dropped
+        self._delivered: OrderedDict[str, None] = OrderedDict()
+        # Holds batches of commands, fetching pauses while it is full
+        self._queue: asyncio.Queue[list[JournalEntry]] = asyncio.Queue(maxsize)
+        # Keeps batches in the queue in the order they were journaled
+        self._put_lock = asyncio.Lock()
+        self._tasks: list[asyncio.Task] = []
+        self._unsub_started: CALLBACK_TYPE | None = None
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks or self._unsub_started)
+
+    @callback
+    def async_start(self) -> None:
+        """Start fetching and firing commands once Home Assistant has started"""
+        if self.running:
+            return
+        # Taken now, commands buffered until the start aren't replayed twice
+        replay = list(self.journal.pending)
+
+        @callback
+        def async_run(hass: HomeAssistant) -> None:
+            # Automations have attached their triggers by now
+            self._unsub_started = None
+            name = self.coordinator.entry.title
+            self._tasks.append(hass.async_create_background_task(
+                self._async_dispatch_loop(replay),
+                f"Tasker {name} command dispatch",
+            ))
+            self._tasks.append(hass.async_create_background_task(
+                self._async_fetch_loop(), f"Tasker {name} command fetch"
+            ))
+
+        unsub = async_at_started(self.hass, async_run)
+        if not self._tasks:
+            self._unsub_started = unsub
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop the channel, buffered commands are replayed on restart"""
+        if self._unsub_started:
+            self._unsub_started()
+            self._unsub_started = None
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        self._queue = asyncio.Queue(self._queue.maxsize)
+
+    async def async_put(self,
+        commands: list[str], batch_id: str | None = None
+    ) -> None:
+        """Buffer commands to be fired, waiting while the buffer is full"""
+        if not commands or not self.running:
+            return
+        if batch_id is not None:
+            if batch_id in self._delivered:
+                _LOGGER.debug("Dropping redelivered Tasker commands %s", batch_id)
+                return
+            self._delivered[batch_id] = None
+            if len(self._delivered) > COMMAND_DEDUP_SIZE:
+                self._delivered.popitem(last=False)
+        async with self._put_lock:
+            entries = await self.journal.async_append(commands)
+            await self._queue.put(entries)
+
+    async def _async_fetch_loop(self) -> None:
+        with request_priority(TaskerPriority.COMMANDS):
+            while True:
+                try:
+                    client = self.coordinator.client
+                    commands = await client.async_get_commands()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    _LOGGER.debug("Error fetching Tasker commands: %s", e)
+                else:
+                    await self.async_put(commands or [])
+                await asyncio.sleep(self.interval.total_seconds())
+
+    async def _async_dispatch_loop(self, replay: list[JournalEntry]) -> None:
+        if replay:
+            # Commands that weren't fired before the last stop go first
+            _LOGGER.info("Replaying %s Tasker commands", len(replay))
+            self._async_fire(replay)
+            await self.journal.async_ack(replay[-1][0])
+        while True:
+            entries = await self._queue.get()
+            self._async_fire(entries)
+            await self.journal.async_ack(entries[-1][0])
+
+    @callback
+    def _async_fire(self, entries: list[JournalEntry]) -> None:
+        """Fire a batch of commands in order"""
+        device_id = self.coordinator.device_id
+        events = []
+        for seq, cmd in entries:
+            cmd_split = cmd.split("=:=")
+            events.append({
+                CONF_COMMAND: cmd,
+                CONF_PREFIX: cmd_split[0],
+                CONF_PARAMS: cmd_split[1:],
+                ATTR_SEQUENCE: seq,
+                CONF_DEVICE_ID: device_id,
+            })
+        if self.batch and len(events) > 1:
+            self.hass.bus.async_fire(
+                TASKER_COMMANDS,
+                {ATTR_COMMANDS: events, CONF_DEVICE_ID: device_id},
+            )
+            return
+        for data in events:
+            self.hass.bus.async_fire(TASKER_COMMAND, data)
@@ -3,6 +3,7 @@ import logging
 from typing import Any, Mapping
 import voluptuous as vol
 
+from homeassistant.components import webhook
 from homeassistant.config_entries import (
     ConfigEntry,
     ConfigFlow,
@@ -18,11 +19,11 @@ from homeassistant.const import (
     CONF_PORT,
     CONF_SCAN_INTERVAL,
     CONF_VARIABLES,
+    CONF_WEBHOOK_ID,
     Platform,
 )
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
 from homeassistant.helpers.selector import (
     BooleanSelector,
     TemplateSelector,
@@ -39,13 +40,40 @@ from taskerapi.const import (
 from taskerapi.exceptions import TaskerAuthError
 
 #from . import async_tasker_device
+from .session import async_get_session_pool
 from .const import (
     DOMAIN,
+    ATTR_PROFILES,
+    ATTR_TASKS,
+    ATTR_SCENES,
+    ATTR_GLOBALS,
+    CONF_ADAPTIVE_POLLING,
+    CONF_BATCH_COMMANDS,
+    CONF_CACHED_TASKS,
+    CONF_COMMAND_INTERVAL,
+    CONF_FAST_OBJECTS,
+    CONF_FAST_SCAN_INTERVAL,
+    CONF_LAZY_ENTITIES,
+    CONF_MAX_CONCURRENT,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_POLL_TIER,
+    CONF_SLOW_OBJECTS,
+    CONF_SLOW_SCAN_INTERVAL,
     CONF_STRUCTURE_GLOBALS,
+    CONF_TASK_CACHE_TTL,
+    DEFAULT_MAX_CONCURRENT,
     DEFAULT_NAME,
     DEFAULT_PORT,
+    FAST_SCAN_INTERVAL,
+    MAX_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
     SCAN_INTERVAL,
+    SLOW_SCAN_INTERVAL,
+    TASK_CACHE_TTL,
+    TaskerPollTier,
 )
+from .polling import poll_key
 
 DATA_SCHEMA = vol.Schema(
     {
@@ -59,6 +87,19 @@ DATA_SCHEMA = vol.Schema(
     }
 )
 
+POLL_TIERS = {
+    TaskerPollTier.FAST: "Fast",
+    TaskerPollTier.NORMAL: "Normal",
+    TaskerPollTier.SLOW: "Slow",
+}
+
+POLL_CATEGORIES = {
+    ATTR_PROFILES: "Profile",
+    ATTR_TASKS: "Task",
+    ATTR_SCENES: "Scene",
+    ATTR_GLOBALS: "Global",
+}
+
 _LOGGER = logging.getLogger(__name__)
 
 class ConfigFlowHandler(ConfigFlow, domain=DOMAIN):
@@ -74,7 +115,7 @@ class ConfigFlowHandler(ConfigFlow, domain=DOMAIN):
         
         if user_input is not None:
             try:
-                client = TaskerClient(
+                client = async_get_session_pool(self.hass).client(
                     user_input[CONF_HOST],
                     user_input[CONF_PORT],
                 )
@@ -101,6 +142,7 @@ class ConfigFlowHandler(ConfigFlow, domain=DOMAIN):
                     title=user_input[CONF_NAME],
                     data={
                         CONF_API_KEY: client.api_key,
+                        CONF_WEBHOOK_ID: webhook.async_generate_id(),
                         **user_input,
                     },
                 )
@@ -127,7 +169,7 @@ class ConfigFlowHandler(ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             try:
                 data = self.entry.data.copy()
-                client = TaskerClient(
+                client = async_get_session_pool(self.hass).client(
                     data[CONF_HOST],
                     data[CONF_PORT]
                 )
@@ -156,12 +198,44 @@ class ConfigFlowHandler(ConfigFlow, domain=DOMAIN):
         
 class OptionsFlowHandler(OptionsFlowWithConfigEntry):
     
+    def _poll_objects(self) -> dict[str, str]:
+        """Return the objects that can have their own polling tier"""
+        choices = {
+            key: key for key in [
+                *self.options.get(CONF_FAST_OBJECTS, []),
+                *self.options.get(CONF_SLOW_OBJECTS, []),
+            ]
+        }
+        if coordinator := self.hass.data.get(DOMAIN, {}).get(
+            self.config_entry.entry_id
+        ):
+            for category, names in coordinator.enabled_names().items():
+                for name in sorted(names):
+                    choices[poll_key(category, name)] = (
+                        f"{POLL_CATEGORIES[category]}: {name}"
+                    )
+        return choices
+        
+    def _tasks(self) -> dict[str, str]:
+        """Return the tasks that can have their results cached"""
+        choices = {
+            name: name for name in self.options.get(CONF_CACHED_TASKS, [])
+        }
+        if coordinator := self.hass.data.get(DOMAIN, {}).get(
+            self.config_entry.entry_id
+        ):
+            choices.update(
+                (name, name) for name in sorted(coordinator.all_tasks)
+            )
+        return choices
+        
     async def async_step_init(self,
         user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
         
+        poll_objects = self._poll_objects()
         options_schema = vol.Schema({
             vol.Required(
                 CONF_VARIABLES,
@@ -179,14 +253,96 @@ class OptionsFlowHandler(OptionsFlowWithConfigEntry):
                     CONF_COMMAND, True
                 ),
             ): BooleanSelector(),
+            # Left unset, commands follow the scan interval
+            vol.Optional(
+                CONF_COMMAND_INTERVAL,
+                description={
+                    "suggested_value": self.options.get(CONF_COMMAND_INTERVAL)
+                },
+            ): vol.All(int, vol.Range(min=1)),
+            vol.Required(
+                CONF_BATCH_COMMANDS,
+                default=self.options.get(CONF_BATCH_COMMANDS, False),
+            ): BooleanSelector(),
             vol.Optional(
                 CONF_SCAN_INTERVAL,
                 default=self.config_entry.data.get(
                     CONF_SCAN_INTERVAL, SCAN_INTERVAL
                 )
             ): int, 
+            vol.Optional(
+                CONF_MAX_CONCURRENT,
+                default=self.options.get(
+                    CONF_MAX_CONCURRENT, DEFAULT_MAX_CONCURRENT
+                ),
+            ): vol.All(int, vol.Range(min=1)),
+            vol.Optional(
+                CONF_FAST_SCAN_INTERVAL,
+                default=self.options.get(
+                    CONF_FAST_SCAN_INTERVAL, FAST_SCAN_INTERVAL
+                ),
+            ): vol.All(int, vol.Range(min=1)),
+            vol.Optional(
+                CONF_SLOW_SCAN_INTERVAL,
+                default=self.options.get(
+                    CONF_SLOW_SCAN_INTERVAL, SLOW_SCAN_INTERVAL
+                ),
+            ): vol.All(int, vol.Range(min=1)),
+            **{
+                vol.Required(
+                    CONF_POLL_TIER.format(category),
+                    default=self.options.get(
+                        CONF_POLL_TIER.format(category),
+                        TaskerPollTier.NORMAL,
+                    ),
+                ): vol.In(POLL_TIERS)
+                for category in POLL_CATEGORIES
+            },
+            vol.Optional(
+                CONF_FAST_OBJECTS,
+                default=self.options.get(CONF_FAST_OBJECTS, []),
+            ): cv.multi_select(poll_objects),
+            vol.Optional(
+                CONF_SLOW_OBJECTS,
+                default=self.options.get(CONF_SLOW_OBJECTS, []),
+            ): cv.multi_select(poll_objects),
+            vol.Required(
+                CONF_ADAPTIVE_POLLING,
+                default=self.options.get(CONF_ADAPTIVE_POLLING, False),
+            ): BooleanSelector(),
+            vol.Optional(
+                CONF_CACHED_TASKS,
+                default=self.options.get(CONF_CACHED_TASKS, []),
+            ): cv.multi_select(self._tasks()),
+            vol.Optional(
+                CONF_TASK_CACHE_TTL,
+                default=self.options.get(
+                    CONF_TASK_CACHE_TTL, TASK_CACHE_TTL
+                ),
+            ): vol.All(int, vol.Range(min=0)),
+            vol.Optional(
+                CONF_MIN_SCAN_INTERVAL,
+                default=self.options.get(
+                    CONF_MIN_SCAN_INTERVAL, MIN_SCAN_INTERVAL
+                ),
+            ): vol.All(int, vol.Range(min=1)),
+            vol.Optional(
+                CONF_MAX_SCAN_INTERVAL,
+                default=self.options.get(
+                    CONF_MAX_SCAN_INTERVAL, MAX_SCAN_INTERVAL
+                ),
+            ): vol.All(int, vol.Range(min=1)),
+            vol.Required(
+                CONF_LAZY_ENTITIES,
+                default=self.options.get(CONF_LAZY_ENTITIES, False),
+            ): BooleanSelector(),
         })
         return self.async_show_form(
             step_id="init",
             data_schema=options_schema,
+            description_placeholders={
+                "webhook_path": webhook.async_generate_path(
+                    self.config_entry.data.get(CONF_WEBHOOK_ID, "")
+                ),
+            },
         )
\ No newline at end of file
@@ -8,6 +8,20 @@ DOMAIN: Final = "tasker"
 
 ATTR_DEVICE_INFO: Final = "device"
 
+ATTR_STATS: Final = "stats"
+ATTR_COMMANDS: Final = "commands"
+ATTR_DATA: Final = "data"
+ATTR_NAMES: Final = "names"
+ATTR_STALE: Final = "stale"
+ATTR_SEQUENCE: Final = "sequence"
+ATTR_ACK: Final = "ack"
+ATTR_ID: Final = "id"
+ATTR_FINGERPRINTS: Final = "fingerprints"
+ATTR_CHANGES: Final = "changes"
+ATTR_CURSOR: Final = "cursor"
+ATTR_REMOVED: Final = "removed"
+ATTR_RESET: Final = "reset"
+
 ATTR_PROFILES: Final = "profiles"
 ATTR_TASKS: Final = "tasks"
 ATTR_SCENES: Final = "scenes"
@@ -23,6 +37,10 @@ ATTR_SIZE: Final = "size"
 ATTR_VALUE: Final = "value"
 
 ATTR_LAST_RETURN: Final = "last_return"
+ATTR_LAST_RETURN_TRUNCATED: Final = "last_return_truncated"
+ATTR_LAST_RETURN_URL: Final = "last_return_url"
+ATTR_CACHE_HITS: Final = "cache_hits"
+ATTR_CACHE_MISSES: Final = "cache_misses"
 
 ATTR_PAR1: Final = "par1"
 ATTR_PAR2: Final = "par2"
@@ -30,8 +48,41 @@ ATTR_VARIABLES: Final = "variables"
 ATTR_STRUCTURE_OUTPUT: Final = "structure_output"
 
 CONF_STRUCTURE_GLOBALS: Final = "structure_globals"
+CONF_MAX_CONCURRENT: Final = "max_concurrent_requests"
+CONF_FAST_SCAN_INTERVAL: Final = "fast_scan_interval"
+CONF_SLOW_SCAN_INTERVAL: Final = "slow_scan_interval"
+CONF_POLL_TIER: Final = "{}_poll_tier"
+CONF_FAST_OBJECTS: Final = "fast_objects"
+CONF_SLOW_OBJECTS: Final = "slow_objects"
+CONF_ADAPTIVE_POLLING: Final = "adaptive_polling"
+CONF_MIN_SCAN_INTERVAL: Final = "min_scan_interval"
+CONF_MAX_SCAN_INTERVAL: Final = "max_scan_interval"
+CONF_COMMAND_INTERVAL: Final = "command_scan_interval"
+CONF_BATCH_COMMANDS: Final = "batch_commands"
+CONF_CACHED_TASKS: Final = "cached_tasks"
+CONF_TASK_CACHE_TTL: Final = "task_cache_ttl"
+CONF_LAZY_ENTITIES: Final = "lazy_entities"
 
 TASKER_COMMAND = "tasker_command"
+TASKER_COMMANDS = "tasker_commands"
+
+SIGNAL_NEW_OBJECTS: Final = "tasker_new_{}_{}"
+
+DATA_SESSION_POOL: Final = "tasker_session_pool"
+DATA_TRIGGER_ROUTER: Final = "tasker_trigger_router"
+DATA_VIEWS: Final = "tasker_views"
+
+STORAGE_KEY: Final = "tasker.{}"
+STORAGE_VERSION: Final = 1
+SNAPSHOT_SAVE_DELAY: Final = 10
+COMMAND_JOURNAL_KEY: Final = "tasker.{}.commands"
+COMMAND_JOURNAL_SIZE: Final = 1000
+COMMAND_JOURNAL_COMPACT_SIZE: Final = 65536
+
+class TaskerPollTier(StrEnum):
+    FAST = "fast"
+    NORMAL = "normal"
+    SLOW = "slow"
 
 class TaskerSceneStatus(StrEnum):
     UNCREATED = "uncreated"
@@ -64,6 +115,7 @@ class TaskerSceneOption(StrEnum):
     
 DEFAULT_NAME: Final = "Tasker"
 DEFAULT_PORT: Final = 1821
+DEFAULT_MAX_CONCURRENT: Final = 3
 
 SERVICE_BACKUP: Final = "backup"
 SERVICE_IMPORT_TASK: Final = "import_task"
@@ -71,6 +123,30 @@ SERVICE_PERFORM_TASK: Final = "perform_task"
 SERVICE_SEND_COMMAND: Final = "send_command"
 
 SCAN_INTERVAL: Final = 900
+FAST_SCAN_INTERVAL: Final = 10
+SLOW_SCAN_INTERVAL: Final = 3600
+MIN_SCAN_INTERVAL: Final = 5
+MAX_SCAN_INTERVAL: Final = 3600
+COMMAND_BUFFER_SIZE: Final = 32
+COMMAND_DEDUP_SIZE: Final = 128
+
+RETRY_ATTEMPTS: Final = 2
+RETRY_BACKOFF: Final = 0.5
+CIRCUIT_FAILURE_THRESHOLD: Final = 3
+CIRCUIT_RESET_TIMEOUT: Final = 60
+
+CHANGES_PATH: Final = "/api/changes"
+
+STRUCTURE_CACHE_SIZE: Final = 64
+# Outputs larger than this are parsed in the executor
+EXECUTOR_PARSE_SIZE: Final = 65536
+LAST_RETURN_MAX_LENGTH: Final = 4096
+
+TASK_CACHE_TTL: Final = 30
+TASK_CACHE_SIZE: Final = 128
+
+WRITE_COALESCE_DELAY: Final = 0.25
+WRITE_REFRESH_COOLDOWN: Final = 2
 
 TASK_BACKUP: Final = "Backup"
 TASK_DEVICE_INFO: Final = "Device Info"
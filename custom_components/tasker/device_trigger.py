@@ -1,14 +1,13 @@
 """Provides device trigger for Tasker commands"""
 import logging
+import re
+from typing import Any, Iterator
 
 import voluptuous as vol
 
 from homeassistant.components.device_automation import (
     DEVICE_TRIGGER_BASE_SCHEMA,
 )
-from homeassistant.components.homeassistant.triggers import (
-    event as event_trigger,
-)
 from homeassistant.const import (
     CONF_COMMAND,
     CONF_DOMAIN,
@@ -16,12 +15,30 @@ from homeassistant.const import (
     CONF_PLATFORM,
     CONF_TYPE,
 )
-from homeassistant.core import HomeAssistant, CALLBACK_TYPE
-import homeassistant.helpers.config_validation as cv
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HassJob,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
 from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN, TASKER_COMMAND
+from .const import (
+    ATTR_COMMANDS,
+    DATA_TRIGGER_ROUTER,
+    DOMAIN,
+    TASKER_COMMAND,
+    TASKER_COMMANDS,
+)
+
+# Patterns without these characters only match commands starting with them
+REGEX_CHARS = frozenset(".^$*+?{}[]\\|()")
+# Backreferences can't be combined into one alternation
+BACKREFERENCE = re.compile(r"\\\d|\(\?P=")
+
+TriggerTarget = tuple[HassJob, dict[str, Any]]
 
 TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend(
     {
@@ -53,22 +70,166 @@ async def async_get_trigger_capabilities(
         )
     }
     
+class TaskerCommandIndex:
+    """Command patterns of a device's triggers, compiled once"""
+    def __init__(self) -> None:
+        self.any: list[TriggerTarget] = []
+        self.literals: dict[str, list[TriggerTarget]] = {}
+        self.patterns: dict[str, tuple[re.Pattern, list[TriggerTarget]]] = {}
+        self._lengths: list[int] = []
+        self._prefilter: re.Pattern | None = None
+
+    def __bool__(self) -> bool:
+        return bool(self.any or self.literals or self.patterns)
+
+    def add(self, command: str | None, target: TriggerTarget) -> None:
+        """Add a trigger's target under its command pattern"""
+        if not command:
+            self.any.append(target)
+        elif REGEX_CHARS.isdisjoint(command):
+            self.literals.setdefault(command, []).append(target)
+            self._lengths = sorted({len(c) for c in self.literals})
+        else:
+            if command not in self.patterns:
+                self.patterns[command] = (re.compile(command), [])
+                self._compile_prefilter()
+            self.patterns[command][1].append(target)
+
+    def remove(self, command: str | None, target: TriggerTarget) -> None:
+        """Remove a trigger's target"""
+        if not command:
+            self.any.remove(target)
+        elif command in self.literals:
+            self.literals[command].remove(target)
+            if not self.literals[command]:
+                del self.literals[command]
+                self._lengths = sorted({len(c) for c in self.literals})
+        elif command in self.patterns:
+            self.patterns[command][1].remove(target)
+            if not self.patterns[command][1]:
+                del self.patterns[command]
+                self._compile_prefilter()
+
+    def _compile_prefilter(self) -> None:
+        """Combine the patterns to skip commands none of them match"""
+        self._prefilter = None
+        if not self.patterns or any(
+            BACKREFERENCE.search(command) for command in self.patterns
+        ):
+            return
+        try:
+            self._prefilter = re.compile(
+                "|".join(f"(?:{command})" for command in self.patterns)
+            )
+        except re.error:
+            pass
+
+    def match(self, command: str) -> Iterator[TriggerTarget]:
+        """Yield the targets whose pattern matches the command"""
+        yield from self.any
+        for length in self._lengths:
+            if length > len(command):
+                break
+            yield from self.literals.get(command[:length], ())
+        if not self.patterns or (
+            self._prefilter is not None and
+            not self._prefilter.match(command)
+        ):
+            return
+        for pattern, targets in self.patterns.values():
+            if pattern.match(command):
+                yield from targets
+
+class TaskerTriggerRouter:
+    """Route Tasker commands to the device triggers they match"""
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._devices: dict[str, TaskerCommandIndex] = {}
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_attach(self,
+        device_id: str,
+        command: str | None,
+        target: TriggerTarget,
+    ) -> CALLBACK_TYPE:
+        """Route a device's matching commands to target"""
+        index = self._devices.setdefault(device_id, TaskerCommandIndex())
+        index.add(command, target)
+        if not self._unsubs:
+            self._unsubs = [
+                self.hass.bus.async_listen(
+                    TASKER_COMMAND, self._async_handle_event
+                ),
+                self.hass.bus.async_listen(
+                    TASKER_COMMANDS, self._async_handle_batch
+                ),
+            ]
+
+        @callback
+        def async_detach() -> None:
+            index.remove(command, target)
+            if not index and self._devices.get(device_id) is index:
+                del self._devices[device_id]
+            if not self._devices:
+                for unsub in self._unsubs:
+                    unsub()
+                self._unsubs = []
+
+        return async_detach
+
+    @callback
+    def _async_handle_batch(self, event: Event) -> None:
+        """Trigger on each command of a batch as if fired on its own"""
+        for data in event.data.get(ATTR_COMMANDS) or []:
+            self._async_handle_event(Event(
+                TASKER_COMMAND,
+                data,
+                event.origin,
+                event.time_fired,
+                event.context,
+            ))
+
+    @callback
+    def _async_handle_event(self, event: Event) -> None:
+        if (device_id := event.data.get(CONF_DEVICE_ID)) is not None:
+            indexes = [self._devices.get(device_id)]
+        else:
+            # Commands fired by hand aren't tied to a device
+            indexes = list(self._devices.values())
+        command = event.data.get(CONF_COMMAND)
+        for index in indexes:
+            if index is None:
+                continue
+            if isinstance(command, str):
+                targets = list(index.match(command))
+            else:
+                targets = list(index.any)
+            for job, trigger_data in targets:
+                self.hass.async_run_hass_job(
+                    job,
+                    {
+                        "trigger": {
+                            **trigger_data,
+                            "platform": "device",
+                            "event": event,
+                            "description": f"event '{event.event_type}'",
+                        }
+                    },
+                    event.context,
+                )
+
 async def async_attach_trigger(
     hass: HomeAssistant,
     config: ConfigType,
     action: TriggerActionType,
     trigger_info: TriggerInfo,
 ) -> CALLBACK_TYPE:
-    event_config = {
-        event_trigger.CONF_PLATFORM: "event",
-        event_trigger.CONF_EVENT_TYPE: TASKER_COMMAND,
-    }
-    if command := config.get(CONF_COMMAND):
-        event_config[event_trigger.CONF_EVENT_DATA] = {
-            CONF_COMMAND: cv.matches_regex(command)
-        }
-    
-    event_config = event_trigger.TRIGGER_SCHEMA(event_config)
-    return await event_trigger.async_attach_trigger(
-        hass, event_config, action, trigger_info, platform_type="device"
-    )
\ No newline at end of file
+    if (router := hass.data.get(DATA_TRIGGER_ROUTER)) is None:
+        router = hass.data[DATA_TRIGGER_ROUTER] = TaskerTriggerRouter(hass)
+    job = HassJob(action, f"tasker command trigger {trigger_info}")
+    return router.async_attach(
+        config[CONF_DEVICE_ID],
+        config.get(CONF_COMMAND),
+        (job, trigger_info["trigger_data"]),
+    )
@@ -1,149 +1,239 @@
 """Helpers for Tasker integration"""
+from collections import OrderedDict
 import csv
-from typing import Any
+import hashlib
+import re
+from typing import Any, Iterable, Sequence
+from xml.parsers.expat import ExpatError
 
-class TaskerProfile:
+import orjson
+import xmltodict
+
+from homeassistant.core import HomeAssistant
+
+from .const import EXECUTOR_PARSE_SIZE, STRUCTURE_CACHE_SIZE
+
+class TaskerRecord:
+    """Read-only state of a Tasker object, kept between polls while unchanged"""
+    __slots__ = ()
     
-    def __init__(self,
-        raw_data = None, *,
-        name = None,
-        enabled = None,
-        active = None,
-    ) -> None:
-        self._name = raw_data.get("name", name)
-        self._enabled = raw_data.get("enabled", enabled)
-        self._active = raw_data.get("active", active)
-        self._raw_data = raw_data or {
-            "name": name,
-            "enabled": enabled,
-            "active": active
-        }
-        
-    @property
-    def name(self) -> str:
-        return self._raw_data["name"]
-        
-    @property
-    def enabled(self) -> bool | None:
-        return self._raw_data.get("enabled")
-        
-    @property
-    def active(self) -> bool | None:
-        return self._raw_data.get("active")
-        
-    def update(self, new_data):
-        self._raw_data.update(new_data)
+    @classmethod
+    def from_object(cls, obj: Any) -> 'TaskerRecord':
+        """Return a record of an object from the Tasker API"""
+        return cls(*(getattr(obj, slot) for slot in cls.__slots__))
+        
+    def matches(self, obj: Any) -> bool:
+        """Return whether an object from the Tasker API has the same state"""
+        for slot in self.__slots__:
+            mine, theirs = getattr(self, slot), getattr(obj, slot, None)
+            # Structured outputs are shared, so skip comparing them deeply
+            if mine is not theirs and mine != theirs:
+                return False
+        return True
+        
+    def as_dict(self) -> dict[str, Any]:
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+        
+    def __eq__(self, other: Any) -> bool:
+        if other is self:
+            return True
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.matches(other)
         
-class TaskerTask:
+    __hash__ = None
     
-    def __init__(self,
-        raw_data = None, *,
-        name = None,
-        running = None,
-        last_return = None,
-    ) -> None:
-        self._raw_data = raw_data or {
-            "name": name,
-            "running": running,
-            "last_return": last_return,
-        }
-        
-    @property
-    def name(self) -> str:
-        return self._raw_data.get["name"]
-        
-    @property
-    def running(self) -> bool | None:
-        return self._raw_data.get("running")
-        
-    @property
-    def last_return(self) -> Any:
-        return self._raw_data.get("last_return")
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{slot}={getattr(self, slot)!r}" for slot in self.__slots__
+        )
+        return f"{type(self).__name__}({fields})"
+        
+class TaskerProfileRecord(TaskerRecord):
+    __slots__ = ("name", "enabled", "active")
+    
+    def __init__(self, name: str, enabled: bool, active: bool = False) -> None:
+        self.name = name
+        self.enabled = enabled
+        self.active = active
         
-    def update(self, new_data):
-        self._raw_data.update(new_data)
+class TaskerTaskRecord(TaskerRecord):
+    __slots__ = ("name", "running")
+    
+    def __init__(self, name: str, running: bool = False) -> None:
+        self.name = name
+        self.running = running
         
-class TaskerScene:
+class TaskerSceneRecord(TaskerRecord):
+    __slots__ = ("name", "status", "display_as", "position", "size")
     
     def __init__(self,
-        raw_data = None, *,
-        name = None,
-        status = None,
+        name: str,
+        status: str,
+        display_as: str = "",
+        position: Sequence[int] = (),
+        size: Sequence[int] = (),
     ) -> None:
-        self._raw_data = raw_data or {
-            "name": name,
-            "status": status,
-        }
-        
-    @property
-    def name(self) -> str:
-        return self._raw_data["name"]
-        
-    @property
-    def status(self) -> str:
-        return self._raw_data.get("status")
-        
-    def update(self, new_data):
-        self._raw_data.update(new_data)
-        
-class TaskerGlobal:
+        self.name = name
+        self.status = status
+        self.display_as = display_as
+        self.position = tuple(position[:2])
+        self.size = tuple(size[:2])
+        
+class TaskerGlobalRecord(TaskerRecord):
+    __slots__ = ("name", "value", "value_json")
     
     def __init__(self,
-        raw_data = None, *,
-        name = None,
-        value = None
+        name: str, value: Any = None, value_json: Any = None
     ) -> None:
-        self._raw_data = raw_data or {
-            "name": name,
-            "value": value,
-        }
-        
-    @property
-    def name(self) -> str:
-        return self._raw_data["name"]
-        
-    @property
-    def value(self) -> Any:
-        return self._raw_data.get("value")
-        
-    def update(self, new_data):
-        self._raw_data.update(new_data)
-        
+        self.name = name
+        self.value = value
+        self.value_json = value_json
+        
+def merge_records(
+    records: dict[str, TaskerRecord],
+    objects: Iterable[Any],
+    record_cls: type[TaskerRecord],
+) -> None:
+    """Merge objects from the Tasker API, keeping unchanged records"""
+    for obj in objects:
+        prev = records.get(obj.name)
+        if prev is None or not prev.matches(obj):
+            records[obj.name] = record_cls.from_object(obj)
+            
+_RE_NUMBER = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?")
+_RE_FLOAT = re.compile(
+    r"\s*[+-]?(?:\d[\d_]*\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*"
+    r"|\s*[+-]?(?:inf|infinity|nan)\s*",
+    re.IGNORECASE,
+)
+_JSON_LITERALS = frozenset(("true", "false", "null"))
+
 def maybe_cast(value):
-    try:
-        if value is None:
-            return ""
-        elif (lower := value.lower()) == "null":
-            return ""
-        elif lower == "true":
-            return True
-        elif lower == "false":
-            return False
-        elif value.isdigit():
-            return int(value)
-        else:
-            return float(value)
-    except:
+    """Maybe cast a value to str, bool, int, or float"""
+    if value is None:
+        return ""
+    if not isinstance(value, str):
         return value
+    if (lower := value.lower()) == "null":
+        return ""
+    if lower == "true":
+        return True
+    if lower == "false":
+        return False
+    # isdigit() accepts superscripts that int() rejects
+    if value.isdecimal():
+        return int(value)
+    if _RE_FLOAT.fullmatch(value):
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    return value
         
 def csv_to_dict(text: str) -> dict[str, Any]:
-    reader = csv.DictReader(
-        text.strip().splitlines(),
-        delimiter=","
-    )
-    out: dict[str, Any] = {}
-    for line in reader:
-        for k, v in line.items():
-            if k is None:
-                continue
-            v = maybe_cast(v)
-            if k in out:
-                out[k].append(v)
-            else:
-                out[k] = [v]
-    if not out:
+    """Return the columns of CSV data with a header row"""
+    rows = [row for row in csv.reader(text.strip().splitlines()) if row]
+    if len(rows) < 2:
         raise csv.Error("Not CSV")
+    # Later columns with the same name win, like csv.DictReader
+    columns = {key: i for i, key in enumerate(rows[0])}
+    body = rows[1:]
+    out: dict[str, Any] = {}
+    for key, i in columns.items():
+        out[key] = [
+            maybe_cast(row[i]) if i < len(row) else "" for row in body
+        ]
     return out
     
+def _xml_postprocessor(path, key, value):
+    return key, maybe_cast(value)
+    
+def parse_output(data: bytes | str | None, encoding: str = "utf-8") -> Any:
+    """Return structure parsed from JSON, XML, HTML, or CSV output"""
+    if data is None:
+        return None
+    text = data.decode(encoding) if isinstance(data, bytes) else data
+    if not (stripped := text.strip()):
+        return maybe_cast(text)
+    first = stripped[0]
+    if first in "{[\"" or stripped in _JSON_LITERALS or (
+        _RE_NUMBER.fullmatch(stripped)
+    ):
+        try:
+            return orjson.loads(stripped)
+        except orjson.JSONDecodeError:
+            pass
+    elif first == "<":
+        try:
+            return xmltodict.parse(
+                stripped, postprocessor=_xml_postprocessor
+            )
+        except (ExpatError, ValueError):
+            pass
+    if "\n" in stripped:
+        try:
+            return csv_to_dict(stripped)
+        except csv.Error:
+            pass
+    return maybe_cast(text)
+    
+def process_task_output(
+    data: bytes, encoding: str, structure_output: bool
+) -> tuple[Any, bool]:
+    """Return a task's output and whether it is a JSON structure"""
+    if not structure_output:
+        return data.decode(encoding), False
+    resp = parse_output(data, encoding)
+    return resp, isinstance(resp, (list, dict))
+    
+async def async_process_task_output(
+    hass: HomeAssistant,
+    data: bytes,
+    encoding: str,
+    structure_output: bool,
+) -> tuple[Any, bool]:
+    """Process a task's output, in the executor if it is large"""
+    if len(data) < EXECUTOR_PARSE_SIZE:
+        return process_task_output(data, encoding, structure_output)
+    return await hass.async_add_executor_job(
+        process_task_output, data, encoding, structure_output
+    )
+    
+def _digest(data: str) -> bytes:
+    return hashlib.blake2b(data.encode(), digest_size=16).digest()
     
-    
\ No newline at end of file
+class TaskerOutputParser:
+    """Parse structured outputs, caching results by a hash of the value"""
+    def __init__(self, maxsize: int = STRUCTURE_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._cache: OrderedDict[bytes, Any] = OrderedDict()
+        
+    def parse(self, data: str | None) -> Any:
+        """Return the structure of data, parsing it only when not cached"""
+        if data is None:
+            return None
+        key = _digest(data)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        return self._store(key, parse_output(data))
+        
+    async def async_parse(self, hass: HomeAssistant, data: str | None) -> Any:
+        """Return the structure of data, parsing large data in the executor"""
+        if data is None or len(data) < EXECUTOR_PARSE_SIZE:
+            return self.parse(data)
+        # The cache is only touched from the event loop
+        key = await hass.async_add_executor_job(_digest, data)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        return self._store(
+            key, await hass.async_add_executor_job(parse_output, data)
+        )
+        
+    def _store(self, key: bytes, result: Any) -> Any:
+        self._cache[key] = result
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+        return result
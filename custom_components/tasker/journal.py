@@ -0,0 +1,158 @@
+"""Durable journal of Tasker commands"""
+import asyncio
+import json
+import logging
+import os
+from typing import Any
+
+from homeassistant.const import CONF_COMMAND
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from .const import (
+    ATTR_ACK,
+    ATTR_SEQUENCE,
+    COMMAND_JOURNAL_COMPACT_SIZE,
+    COMMAND_JOURNAL_KEY,
+    COMMAND_JOURNAL_SIZE,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+JournalEntry = tuple[int, str]
+
+class TaskerCommandJournal:
+    """Append-only log of commands until they have been fired"""
+    def __init__(self,
+        hass: HomeAssistant,
+        entry_id: str,
+        max_pending: int = COMMAND_JOURNAL_SIZE,
+        compact_size: int = COMMAND_JOURNAL_COMPACT_SIZE,
+    ) -> None:
+        self.hass = hass
+        self.path = hass.config.path(
+            STORAGE_DIR, COMMAND_JOURNAL_KEY.format(entry_id)
+        )
+        self.max_pending = max_pending
+        self.compact_size = compact_size
+        self.sequence: int = 0
+        self.pending: list[JournalEntry] = []
+        self._acked: int = 0
+        self._size: int = 0
+        self._lock = asyncio.Lock()
+
+    async def async_load(self) -> None:
+        """Load the commands that were never acknowledged"""
+        records, self._size, clean = await self.hass.async_add_executor_job(
+            self._read
+        )
+        commands: dict[int, str] = {}
+        for record in records:
+            if ATTR_ACK in record:
+                self._acked = max(self._acked, record[ATTR_ACK])
+            elif ATTR_SEQUENCE in record:
+                commands[record[ATTR_SEQUENCE]] = record[CONF_COMMAND]
+        self.pending = sorted(
+            (seq, cmd) for seq, cmd in commands.items() if seq > self._acked
+        )
+        self.sequence = max(self._acked, *commands, 0)
+        if not clean:
+            # Don't append after a line cut short by a crash
+            async with self._lock:
+                await self._async_compact()
+
+    async def async_append(self, commands: list[str]) -> list[JournalEntry]:
+        """Number commands and record them before they are fired"""
+        async with self._lock:
+            entries = []
+            for cmd in commands:
+                self.sequence += 1
+                entries.append((self.sequence, cmd))
+            await self._async_write([
+                {ATTR_SEQUENCE: seq, CONF_COMMAND: cmd} for seq, cmd in entries
+            ])
+            self.pending.extend(entries)
+            if (overflow := len(self.pending) - self.max_pending) > 0:
+                _LOGGER.warning(
+                    "Tasker command journal is full, dropping %s oldest",
+                    overflow,
+                )
+                await self._async_ack(self.pending[overflow - 1][0])
+            return entries
+
+    async def async_ack(self, sequence: int) -> None:
+        """Record that commands up to sequence have been fired"""
+        async with self._lock:
+            await self._async_ack(sequence)
+
+    async def async_remove(self) -> None:
+        """Remove the journal file"""
+        await self.hass.async_add_executor_job(self._remove)
+
+    async def _async_ack(self, sequence: int) -> None:
+        if sequence <= self._acked:
+            return
+        self._acked = sequence
+        self.pending = [e for e in self.pending if e[0] > sequence]
+        if self._size < self.compact_size:
+            await self._async_write([{ATTR_ACK: sequence}])
+        else:
+            await self._async_compact()
+
+    async def _async_compact(self) -> None:
+        """Rewrite the journal with only the unacknowledged commands"""
+        lines = [
+            {ATTR_SEQUENCE: seq, CONF_COMMAND: cmd} for seq, cmd in self.pending
+        ]
+        lines.append({ATTR_ACK: self._acked})
+        self._size = await self.hass.async_add_executor_job(
+            self._rewrite, _dump(lines)
+        )
+
+    async def _async_write(self, lines: list[dict[str, Any]]) -> None:
+        self._size += await self.hass.async_add_executor_job(
+            self._append, _dump(lines)
+        )
+
+    def _read(self) -> tuple[list[dict[str, Any]], int, bool]:
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return [], 0, True
+        records = []
+        clean = not data or data.endswith("\n")
+        for line in data.splitlines():
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                # A line cut short by a crash was never acknowledged
+                _LOGGER.warning("Skipping corrupt Tasker command journal line")
+                clean = False
+        return records, len(data.encode()), clean
+
+    def _append(self, data: str) -> int:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        return len(data.encode())
+
+    def _rewrite(self, data: str) -> int:
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self.path)
+        return len(data.encode())
+
+    def _remove(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+def _dump(lines: list[dict[str, Any]]) -> str:
+    return "".join(json.dumps(line) + "\n" for line in lines)
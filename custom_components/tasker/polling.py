@@ -0,0 +1,93 @@
+"""Polling tiers for the Tasker coordinator"""
+from datetime import datetime, timedelta
+from typing import Iterable
+
+from .const import TaskerPollTier
+
+# Scheduled refreshes may fire slightly early
+DUE_TOLERANCE = timedelta(seconds=1)
+MIN_INTERVAL = timedelta(seconds=1)
+
+# Adaptive polling multipliers
+TIGHTEN_FACTOR = 0.5
+BACKOFF_FACTOR = 1.5
+
+PollGroup = tuple[str, TaskerPollTier]
+
+def poll_key(category: str, name: str) -> str:
+    """Return the option key of an object's polling tier"""
+    return f"{category}:{name}"
+
+class TaskerPollScheduler:
+    """Track when each category's polling tiers are next due"""
+    def __init__(self,
+        intervals: dict[TaskerPollTier, timedelta],
+        adaptive: bool = False,
+        min_interval: timedelta = MIN_INTERVAL,
+        max_interval: timedelta | None = None,
+    ) -> None:
+        self._next: dict[PollGroup, datetime] = {}
+        self._adapted: dict[PollGroup, timedelta] = {}
+        self.configure(intervals, adaptive, min_interval, max_interval)
+
+    def configure(self,
+        intervals: dict[TaskerPollTier, timedelta],
+        adaptive: bool = False,
+        min_interval: timedelta = MIN_INTERVAL,
+        max_interval: timedelta | None = None,
+    ) -> None:
+        """Change the intervals, starting adaptation over"""
+        self.intervals = intervals
+        self.adaptive = adaptive
+        self.min_interval = max(min_interval, MIN_INTERVAL)
+        self.max_interval = max_interval
+        self._adapted.clear()
+
+    def interval(self, group: PollGroup) -> timedelta:
+        """Return the current interval of a category's tier"""
+        return self._adapted.get(group, self.intervals[group[1]])
+
+    def due(self,
+        now: datetime,
+        groups: Iterable[PollGroup],
+        force: bool = False,
+    ) -> set[PollGroup]:
+        """Return the groups that should be polled now"""
+        if force:
+            return set(groups)
+        return {
+            group for group in groups
+            if self._next.get(group, now) <= now + DUE_TOLERANCE
+        }
+
+    def polled(self,
+        groups: Iterable[PollGroup],
+        now: datetime,
+        changed: set[PollGroup] | None = None,
+    ) -> None:
+        """Record that groups were polled and whether they changed"""
+        for group in groups:
+            if self.adaptive and changed is not None:
+                interval = self.interval(group) * (
+                    TIGHTEN_FACTOR if group in changed else BACKOFF_FACTOR
+                )
+                if self.max_interval is not None:
+                    interval = min(interval, self.max_interval)
+                self._adapted[group] = max(interval, self.min_interval)
+            self._next[group] = now + self.interval(group)
+
+    def failed(self, groups: Iterable[PollGroup], now: datetime) -> None:
+        """Record that polling groups failed, keeping their interval"""
+        for group in groups:
+            self._next[group] = now + self.interval(group)
+
+    def next_interval(
+        self, now: datetime, groups: Iterable[PollGroup]
+    ) -> timedelta | None:
+        """Return the time until the next of the given groups is due"""
+        due = [
+            self._next.get(group, now) - now for group in groups
+        ]
+        if not due:
+            return None
+        return max(min(due), MIN_INTERVAL)
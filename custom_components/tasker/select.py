@@ -1,4 +1,6 @@
 """Support for Tasker scenes"""
+from functools import partial
+
 from homeassistant.components.select import (
     SelectEntity,
 )
@@ -23,6 +25,7 @@ from . import (
     TaskerEntity,
     TaskerDataUpdateCoordinator
 )
+from .client import TaskerPriority, request_priority
 from .const import (
     DOMAIN,
     TaskerSceneOption,
@@ -66,9 +69,10 @@ async def async_setup_entry(
 ) -> None:
     coordinator = hass.data[DOMAIN][entry.entry_id]
     
-    async_add_entities(
-        TaskerSceneSelect(coordinator, name)
-        for name in coordinator.all_scenes
+    coordinator.async_add_object_entities(
+        ATTR_SCENES,
+        partial(TaskerSceneSelect, coordinator),
+        async_add_entities,
     )
     
 
@@ -119,8 +123,6 @@ class TaskerSceneSelect(TaskerEntity, SelectEntity):
             #    ATTR_SIZE: data.get(ATTR_SIZE),
             #}
             #self.async_write_ha_state()
-        elif self.name not in self.coordinator.data.scenes_to_add:
-            self.hass and self.hass.async_add_job(self.async_remove)
             
     @property
     def icon(self) -> str:
@@ -133,8 +135,6 @@ class TaskerSceneSelect(TaskerEntity, SelectEntity):
     async def async_added_to_hass(self):
         await super().async_added_to_hass()
         self.coordinator.enabled_scenes.add(self.name)
-        if self.coordinator.data:
-            self.coordinator.data.scenes_to_add.discard(self.name)
         
     async def async_will_remove_from_hass(self):
         await super().async_will_remove_from_hass()
@@ -148,13 +148,16 @@ class TaskerSceneSelect(TaskerEntity, SelectEntity):
             option = TaskerSceneOption.OVERLAY
         display_as = option if action == TaskerSceneAction.SHOW else None
             
-        data = await self.coordinator.client.async_set_scene(
-            self.name,
-            action,
-            display_as
-        )
-        self._handle_update(data)
-        await self.coordinator.async_request_refresh()
+        with request_priority(TaskerPriority.INTERACTIVE):
+            data = await self.coordinator.client.async_set_scene(
+                self.name,
+                action,
+                display_as
+            )
+            self._handle_update(data)
+            await self.coordinator.async_refresh_objects(
+                ATTR_SCENES, [self.name]
+            )
         
         
         
@@ -42,8 +42,10 @@ from . import (
     TaskerEntity,
     TaskerDataUpdateCoordinator,
 )
+from .client import TaskerPriority, request_priority
 from .const import (
     DOMAIN,
+    ATTR_STALE,
  
     SERVICE_BACKUP,
     SERVICE_IMPORT_TASK,
@@ -105,10 +107,6 @@ class TaskerSensor(TaskerEntity, SensorEntity):
     def state_class(self) -> SensorStateClass:
         return SensorStateClass.MEASUREMENT
         
-    async def async_added_to_hass(self):
-        await super().async_added_to_hass()
-        await self.coordinator.async_request_refresh()
-        
     @callback
     def _handle_coordinator_update(self) -> None:
         stats = self.coordinator.data.stats
@@ -120,17 +118,24 @@ class TaskerSensor(TaskerEntity, SensorEntity):
             ATTR_GLOBALS: stats.total_globals,
             ATTR_SW_VERSION: stats.version,
         }
+        if stale := self.coordinator.data.stale:
+            self._attr_extra_state_attributes[ATTR_STALE] = {
+                category: since.isoformat()
+                for category, since in stale.items()
+            }
         self.async_write_ha_state()
         
     async def async_import_task(self, xml: str, name: str | None = None):
-        await self.coordinator.client.async_import_task(xml, name)
+        with request_priority(TaskerPriority.INTERACTIVE):
+            await self.coordinator.client.async_import_task(xml, name)
         
     async def async_backup_tasker(self, username: str | None = None):
-        await async_backup(
-            self.coordinator.client,
-            username=username,
-            import_task=TASK_BACKUP not in self.coordinator.all_tasks
-        )
+        with request_priority(TaskerPriority.BACKUP):
+            await async_backup(
+                self.coordinator.client,
+                username=username,
+                import_task=TASK_BACKUP not in self.coordinator.all_tasks
+            )
         """
         await self.coordinator.client.async_perform_task(
             TASK_BACKUP,
@@ -139,7 +144,8 @@ class TaskerSensor(TaskerEntity, SensorEntity):
         """
         
     async def async_send_command(self, command: str):
-        await self.coordinator.client.async_send_commands(command)
+        with request_priority(TaskerPriority.COMMANDS):
+            await self.coordinator.client.async_send_commands(command)
         
         
         
@@ -0,0 +1,82 @@
+"""Shared HTTP sessions for Tasker clients"""
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import AsyncIterator
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+
+from taskerapi import TaskerClient
+
+from .const import DATA_SESSION_POOL
+
+class TaskerSessionPool:
+    """Keep-alive sessions shared by every client talking to a host"""
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._sessions: dict[str, aiohttp.ClientSession] = {}
+        self._refs: dict[str, int] = {}
+
+    @callback
+    def async_get_session(self, host: str) -> aiohttp.ClientSession:
+        """Return the pooled session for a host"""
+        if (session := self._sessions.get(host)) is None:
+            session = self._sessions[host] = async_create_clientsession(
+                self.hass, verify_ssl=False, auto_cleanup=False
+            )
+        return session
+
+    @asynccontextmanager
+    async def _async_borrow(
+        self, host: str, **kwargs
+    ) -> AsyncIterator[aiohttp.ClientSession]:
+        # TaskerClient closes the session it is given, so lend it instead
+        yield self.async_get_session(host)
+
+    @callback
+    def client(self,
+        host: str,
+        port: int,
+        api_key: str | None = None,
+        client_cls: type[TaskerClient] = TaskerClient,
+        **kwargs,
+    ) -> TaskerClient:
+        """Return a client that uses the pooled session for its host"""
+        return client_cls(
+            host,
+            port,
+            api_key,
+            session_fn=partial(self._async_borrow, host),
+            **kwargs,
+        )
+
+    @callback
+    def async_acquire(self,
+        host: str,
+        port: int,
+        api_key: str | None = None,
+        client_cls: type[TaskerClient] = TaskerClient,
+        **kwargs,
+    ) -> TaskerClient:
+        """Return a client and keep its session open until released"""
+        self._refs[host] = self._refs.get(host, 0) + 1
+        return self.client(host, port, api_key, client_cls, **kwargs)
+
+    @callback
+    def async_release(self, host: str) -> None:
+        """Release a host, closing its session if no longer used"""
+        self._refs[host] = self._refs.get(host, 1) - 1
+        if self._refs[host] > 0:
+            return
+        self._refs.pop(host)
+        if session := self._sessions.pop(host, None):
+            session.detach()
+
+@callback
+def async_get_session_pool(hass: HomeAssistant) -> TaskerSessionPool:
+    """Return the shared Tasker session pool"""
+    if (pool := hass.data.get(DATA_SESSION_POOL)) is None:
+        pool = hass.data[DATA_SESSION_POOL] = TaskerSessionPool(hass)
+    return pool
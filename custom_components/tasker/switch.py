@@ -1,4 +1,6 @@
 """Support for Tasker profiles"""
+from functools import partial
+
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -28,9 +30,10 @@ async def async_setup_entry(
 ) -> None:
     coordinator = hass.data[DOMAIN][entry.entry_id]
     
-    async_add_entities(
-        TaskerProfileSwitch(coordinator, name)
-        for name in coordinator.all_profiles
+    coordinator.async_add_object_entities(
+        ATTR_PROFILES,
+        partial(TaskerProfileSwitch, coordinator),
+        async_add_entities,
     )
     
 
@@ -55,10 +58,6 @@ class TaskerProfileSwitch(TaskerEntity, SwitchEntity):
             self.async_write_ha_state()
             """
             self._handle_update(data)
-        """
-        elif self.name not in self.coordinator.data.profiles_to_add:
-            self.hass and self.hass.async_add_job(self.async_remove)
-        """
         
     @property
     def icon(self) -> str:
@@ -67,19 +66,18 @@ class TaskerProfileSwitch(TaskerEntity, SwitchEntity):
     async def async_added_to_hass(self):
         await super().async_added_to_hass()
         self.coordinator.enabled_profiles.add(self.name)
-        if self.coordinator.data:
-            self.coordinator.data.profiles_to_add.discard(self.name)
         
     async def async_will_remove_from_hass(self):
         await super().async_will_remove_from_hass()
         self.coordinator.enabled_profiles.discard(self.name)
         
     async def _async_set_enabled(self, enabled: bool | None = None):
-        data = await self.coordinator.client.async_set_profile(
-            self.name, enabled
+        if enabled is None and self.is_on is not None:
+            # Coalesced writes are last-write-wins, so resolve toggles now
+            enabled = not self.is_on
+        await self.coordinator.writer.async_write(
+            ATTR_PROFILES, self.name, enabled
         )
-        self._handle_update(data)
-        await self.coordinator.async_request_refresh()
         
     async def async_turn_on(self, **kwargs):
         await self._async_set_enabled(True)
@@ -1,4 +1,5 @@
 """Support for Tasker globals"""
+from functools import partial
 import logging
 
 from homeassistant.components.text import TextEntity
@@ -7,6 +8,7 @@ from homeassistant.const import (
     CONF_VARIABLES,
 )
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.json import json_dumps
 from homeassistant.util.json import JsonArrayType, JsonObjectType
@@ -35,14 +37,17 @@ async def async_setup_entry(
 ) -> None:
     coordinator = hass.data[DOMAIN][entry.entry_id]
     
-    async_add_entities(
-        [
-            TaskerGlobalText(coordinator, name)
-            for name in coordinator.all_globals
-        ] + [
-            TaskerBuiltinText(coordinator, name)
-            for name in coordinator.builtin_globals
-        ]
+    @callback
+    def async_add_builtins(names: set[str]) -> None:
+        async_add_entities(
+            TaskerBuiltinText(coordinator, name) for name in names
+        )
+    
+    async_add_builtins(coordinator.builtin_globals)
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, coordinator.signal_new(CONF_VARIABLES), async_add_builtins
+        )
     )
     """
     async_add_entities(
@@ -53,6 +58,12 @@ async def async_setup_entry(
         ]
     )
     """
+    
+    coordinator.async_add_object_entities(
+        ATTR_GLOBALS,
+        partial(TaskerGlobalText, coordinator),
+        async_add_entities,
+    )
 
 class TaskerGlobalText(TaskerEntity, TextEntity):
     
@@ -83,6 +94,8 @@ class TaskerGlobalText(TaskerEntity, TextEntity):
             self._attr_extra_state_attributes = {
                 "value_json": data.value_json
             }
+        else:
+            self._attr_extra_state_attributes = {}
         if write_state:
             self.async_write_ha_state()
             
@@ -114,16 +127,15 @@ class TaskerGlobalText(TaskerEntity, TextEntity):
         await super().async_added_to_hass()
         _LOGGER.warning(f"{self.var_name} added to hass")
         self.coordinator.enabled_globals.add(self.var_name)
-        if self.coordinator.data:
-            self.coordinator.data.globals_to_add.discard(self.var_name)
         
     async def async_will_remove_from_hass(self):
         await super().async_will_remove_from_hass()
         self.coordinator.enabled_globals.discard(self.var_name)
         
     async def async_set_value(self, value):
-        await self.coordinator.client.async_set_global(self.var_name, value)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.writer.async_write(
+            ATTR_GLOBALS, self.var_name, value
+        )
         
 class TaskerBuiltinText(TaskerGlobalText):
     
@@ -133,6 +145,7 @@ class TaskerBuiltinText(TaskerGlobalText):
     ) -> None:
         super().__init__(coordinator, BUILTIN_GLOBALS[name])
         self._var_name: str = name
+        self.coordinator_context = name
         
     @property
     def do_structure(self) -> bool:
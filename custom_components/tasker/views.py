@@ -0,0 +1,39 @@
+"""HTTP views for Tasker"""
+from http import HTTPStatus
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.const import CONTENT_TYPE_JSON
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.json import json_dumps
+
+from .const import DATA_VIEWS, DOMAIN
+
+LAST_RETURN_URL = "/api/tasker/last_return/{entity_id}"
+
+class TaskerLastReturnView(HomeAssistantView):
+    """Serve the full output of a Tasker task's last run"""
+    url = LAST_RETURN_URL
+    name = "api:tasker:last_return"
+
+    async def get(self, request: web.Request, entity_id: str) -> web.Response:
+        hass: HomeAssistant = request.app["hass"]
+        for coordinator in hass.data.get(DOMAIN, {}).values():
+            if (last_return := coordinator.last_returns.get(entity_id)):
+                value, is_json = last_return
+                return web.Response(
+                    text=json_dumps(value) if is_json else str(value),
+                    content_type=CONTENT_TYPE_JSON if is_json else "text/plain",
+                )
+        return self.json_message(
+            "No output for this task", HTTPStatus.NOT_FOUND
+        )
+
+@callback
+def async_register_views(hass: HomeAssistant) -> None:
+    """Register the Tasker views once"""
+    if hass.data.get(DATA_VIEWS):
+        return
+    hass.data[DATA_VIEWS] = True
+    hass.http.register_view(TaskerLastReturnView())
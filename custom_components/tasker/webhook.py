@@ -0,0 +1,124 @@
+"""Support for Tasker pushing updates to Home Assistant"""
+from http import HTTPStatus
+import logging
+from typing import Any
+
+from aiohttp import web
+
+from homeassistant.components import webhook
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_WEBHOOK_ID
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from taskerapi.typing import (
+    TaskerProfile,
+    TaskerTask,
+    TaskerScene,
+    TaskerGlobal,
+)
+
+from .const import (
+    DOMAIN,
+    ATTR_COMMANDS,
+    ATTR_ID,
+    ATTR_PROFILES,
+    ATTR_TASKS,
+    ATTR_SCENES,
+    ATTR_GLOBALS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+PUSH_TYPES = {
+    ATTR_PROFILES: TaskerProfile,
+    ATTR_TASKS: TaskerTask,
+    ATTR_SCENES: TaskerScene,
+    ATTR_GLOBALS: TaskerGlobal,
+}
+
+@callback
+def async_ensure_webhook_id(hass: HomeAssistant, entry: ConfigEntry) -> str:
+    """Return the entry's webhook id, creating one if needed"""
+    if not (webhook_id := entry.data.get(CONF_WEBHOOK_ID)):
+        webhook_id = webhook.async_generate_id()
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_WEBHOOK_ID: webhook_id}
+        )
+    return webhook_id
+
+def _parse_objects(
+    category: str,
+    items: list[dict[str, Any]],
+    current: dict[str, Any],
+) -> list[Any]:
+    """Build Tasker objects from pushed items, merging partial updates"""
+    objects = []
+    for item in items:
+        if (name := item.get("name")) is None:
+            continue
+        if (prev := current.get(name)) is not None:
+            # Fields that weren't pushed keep the previous record's values
+            item = {**prev.as_dict(), **item}
+        item.pop("value_json", None)
+        objects.append(PUSH_TYPES[category](**item))
+    return objects
+
+@callback
+def async_register_webhook(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    coordinator,
+) -> CALLBACK_TYPE:
+    """Register the webhook Tasker pushes changes and commands to"""
+    webhook_id = entry.data[CONF_WEBHOOK_ID]
+
+    async def async_handle_webhook(
+        hass: HomeAssistant, webhook_id: str, request: web.Request
+    ) -> web.Response | None:
+        try:
+            payload = await request.json()
+            if not isinstance(payload, dict):
+                raise ValueError("Expected a JSON object")
+            current = coordinator.data
+            updates = {
+                category: _parse_objects(
+                    category,
+                    payload[category],
+                    getattr(current, category) if current else {},
+                )
+                for category in PUSH_TYPES
+                if payload.get(category)
+            }
+            commands = [str(c) for c in payload.get(ATTR_COMMANDS) or []]
+            if (batch_id := payload.get(ATTR_ID)) is not None:
+                batch_id = str(batch_id)
+        except (AttributeError, TypeError, ValueError) as e:
+            _LOGGER.warning("Invalid Tasker webhook payload: %s", e)
+            return web.Response(status=HTTPStatus.BAD_REQUEST)
+
+        await coordinator.async_structure_globals(
+            updates.get(ATTR_GLOBALS) or []
+        )
+        coordinator.async_push_update(updates)
+        # Waits while the command buffer is full
+        await coordinator.commands.async_put(commands, batch_id)
+        return None
+
+    webhook.async_register(
+        hass,
+        DOMAIN,
+        entry.title,
+        webhook_id,
+        async_handle_webhook,
+        local_only=True,
+    )
+    _LOGGER.info(
+        "Tasker can push updates to %s",
+        webhook.async_generate_path(webhook_id),
+    )
+
+    @callback
+    def async_unregister() -> None:
+        webhook.async_unregister(hass, webhook_id)
+
+    return async_unregister
@@ -0,0 +1,133 @@
+"""Write coalescing for Tasker profiles and globals"""
+import asyncio
+from datetime import datetime
+import logging
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.event import async_call_later
+
+from taskerapi.typing import TaskerProfile
+
+from .client import TaskerPriority, request_priority
+from .const import (
+    ATTR_PROFILES,
+    ATTR_GLOBALS,
+    WRITE_COALESCE_DELAY,
+    WRITE_REFRESH_COOLDOWN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+class TaskerWriteQueue:
+    """Batch writes arriving within a short window, last write wins"""
+    def __init__(self,
+        hass: HomeAssistant,
+        coordinator,
+        delay: float = WRITE_COALESCE_DELAY,
+    ) -> None:
+        self.hass = hass
+        self.coordinator = coordinator
+        self.delay = delay
+
+        self._pending: dict[str, dict[str, Any]] = {
+            ATTR_PROFILES: {},
+            ATTR_GLOBALS: {},
+        }
+        self._waiters: dict[str, list[asyncio.Future]] = {
+            ATTR_PROFILES: [],
+            ATTR_GLOBALS: [],
+        }
+        self._touched: dict[str, set[str]] = {
+            ATTR_PROFILES: set(),
+            ATTR_GLOBALS: set(),
+        }
+        self._unsub_flush: CALLBACK_TYPE | None = None
+        self._refresh = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=WRITE_REFRESH_COOLDOWN,
+            immediate=False,
+            function=self._async_refresh_touched,
+        )
+
+    async def async_write(self, category: str, name: str, value: Any) -> None:
+        """Queue a write and wait until its batch has been sent"""
+        self._pending[category][name] = value
+        waiter = self.hass.loop.create_future()
+        self._waiters[category].append(waiter)
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(
+                self.hass, self.delay, self._async_flush
+            )
+        await waiter
+
+    async def _async_send(self, category: str, values: dict[str, Any]) -> list:
+        names = list(values)
+        if category == ATTR_PROFILES:
+            resp = await self.coordinator.client.async_set_profiles(
+                names, [values[n] for n in names]
+            )
+            return [TaskerProfile(**p) for p in resp or []]
+        global_vars = await self.coordinator.client.async_set_globals(
+            names, [values[n] for n in names], structure_outputs=False
+        ) or []
+        await self.coordinator.async_structure_globals(global_vars)
+        return global_vars
+
+    async def _async_flush(self, _now: datetime | None = None) -> None:
+        self._unsub_flush = None
+        pending = {c: v for c, v in self._pending.items() if v}
+        waiters = self._waiters
+        self._pending = {c: {} for c in self._pending}
+        self._waiters = {c: [] for c in self._waiters}
+
+        with request_priority(TaskerPriority.INTERACTIVE):
+            results = await asyncio.gather(
+                *(
+                    self._async_send(category, values)
+                    for category, values in pending.items()
+                ),
+                return_exceptions=True,
+            )
+        updates = {}
+        for category, result in zip(pending, results):
+            if isinstance(result, BaseException):
+                _LOGGER.warning(
+                    "Error writing Tasker %s: %s", category, result
+                )
+            else:
+                updates[category] = result
+                self._touched[category].update(pending[category])
+            for waiter in waiters[category]:
+                if waiter.done():
+                    continue
+                if isinstance(result, BaseException):
+                    waiter.set_exception(result)
+                else:
+                    waiter.set_result(None)
+        if updates:
+            self.coordinator.async_push_update(updates)
+            await self._refresh.async_call()
+
+    async def _async_refresh_touched(self) -> None:
+        touched = {c: n for c, n in self._touched.items() if n}
+        self._touched = {c: set() for c in self._touched}
+        await asyncio.gather(
+            *(
+                self.coordinator.async_refresh_objects(category, list(names))
+                for category, names in touched.items()
+            )
+        )
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel any pending writes and refresh"""
+        if self._unsub_flush:
+            self._unsub_flush()
+            self._unsub_flush = None
+        for waiters in self._waiters.values():
+            for waiter in waiters:
+                waiter.cancel()
+        self._refresh.async_cancel()
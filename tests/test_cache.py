@@ -0,0 +1,26 @@
+"""Tests for the Tasker task cache"""
+import asyncio
+
+from custom_components.tasker.cache import TaskerTaskCache
+
+
+def test_joined_calls_survive_cancelled_first_call():
+    async def run():
+        cache = TaskerTaskCache(["Locate"], 30)
+        runs = []
+
+        async def perform():
+            runs.append(None)
+            await asyncio.sleep(0.05)
+            return len(runs)
+
+        first = asyncio.create_task(cache.async_get("Locate", (), perform))
+        await asyncio.sleep(0)
+        joined = asyncio.create_task(cache.async_get("Locate", (), perform))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await asyncio.gather(first, joined, return_exceptions=True)
+
+    first, joined = asyncio.run(run())
+    assert isinstance(first, asyncio.CancelledError)
+    assert joined == 2
@@ -0,0 +1,25 @@
+"""Tests for Tasker helpers"""
+from custom_components.tasker.helpers import (
+    maybe_cast,
+    parse_output,
+    process_task_output,
+)
+
+
+def test_structured_task_output_stays_native():
+    output, is_json = process_task_output(b'{"a": [1, 2]}', "utf-8", True)
+    assert output == {"a": [1, 2]}
+    assert is_json
+
+
+def test_unstructured_task_output_is_text():
+    output, is_json = process_task_output(b'{"a": 1}', "utf-8", False)
+    assert output == '{"a": 1}'
+    assert not is_json
+
+
+def test_superscript_digits_stay_text():
+    assert parse_output("²") == "²"
+    assert parse_output("a,b\n1,³") == {"a": [1], "b": ["³"]}
+    assert maybe_cast("²") == "²"
+    assert maybe_cast("12") == 12
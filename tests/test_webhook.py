@@ -0,0 +1,46 @@
+"""Tests for Tasker webhook payloads"""
+from custom_components.tasker.helpers import (
+    TaskerGlobalRecord,
+    TaskerProfileRecord,
+    TaskerSceneRecord,
+)
+from custom_components.tasker.webhook import _parse_objects
+
+
+def test_partial_update_of_existing_profile():
+    current = {"Sleep": TaskerProfileRecord("Sleep", True, False)}
+    [profile] = _parse_objects(
+        "profiles", [{"name": "Sleep", "active": True}], current
+    )
+    assert (profile.name, profile.enabled, profile.active) == (
+        "Sleep", True, True
+    )
+    assert not current["Sleep"].active
+
+
+def test_partial_update_of_existing_scene():
+    current = {
+        "Popup": TaskerSceneRecord("Popup", "uncreated", "Dialog", [1, 2])
+    }
+    [scene] = _parse_objects(
+        "scenes", [{"name": "Popup", "status": "visible"}], current
+    )
+    assert scene.status == "visible"
+    assert scene.display_as == "Dialog"
+    assert tuple(scene.position) == (1, 2)
+
+
+def test_update_of_existing_global_drops_structured_output():
+    current = {"Mood": TaskerGlobalRecord("Mood", "sad", {"a": 1})}
+    [global_var] = _parse_objects(
+        "globals", [{"name": "Mood", "value": "happy"}], current
+    )
+    assert global_var.value == "happy"
+    assert global_var.value_json is None
+
+
+def test_new_object_and_nameless_item():
+    objects = _parse_objects(
+        "tasks", [{"name": "Notify", "running": True}, {"running": False}], {}
+    )
+    assert [(t.name, t.running) for t in objects] == [("Notify", True)]